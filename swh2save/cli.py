@@ -18,31 +18,33 @@
 
 import os
 import sys
-import math
 import json
 import argparse
 import textwrap
-import itertools
+import functools
 
 from . import __version__
-from .gamedata import *
-from .datafile import StringStorage
-from .savefile import Savefile, InventoryItem, InMissionSavegameException
-
-def column_chunks(l, columns):
-    """
-    Divide up a given list `l` into the specified number of
-    `columns`.  Yields each column in turn, as a list.  (Does
-    *not* do any padding.)
-    """
-    length = len(l)
-    if length == 0:
-        yield []
-    else:
-        n = math.ceil(length/columns)
-        for i in range(0, length, n):
-            yield l[i:i + n]
 
+# Translation table used by the `--check --debug` hexdump, which maps any byte
+# we don't want to print directly over to a `.`
+HEXDUMP_PRINTABLE = frozenset(b'0123456789abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ!"#$%&\'()*+,-./:;<=>?@[\\]^_`{|}~ ')
+HEXDUMP_TABLE = bytes([
+    byte if byte in HEXDUMP_PRINTABLE else ord('.')
+    for byte in range(256)
+    ])
+
+# Warning shown before we make any edits (unless --no-warning is used)
+EDIT_WARNING = textwrap.dedent("""
+    ***WARNING**
+    Due to the nature of the savegame format, and the fact that this utility
+    doesn't actually understand the entire format yet, edits performed to
+    your savegames have a small but nonzero chance of resulting in corrupted
+    savegames.  I believe the risk is extremely small, but keep it in mind!
+    Even if previous similar edits have worked fine, it's possible that this
+    could encounter an edge case which results in an invalid save file.  Keep
+    backups of your saves, and use with caution!
+    ***WARNING**
+    """)
 
 def print_columns(
         data,
@@ -87,43 +89,61 @@ def print_columns(
     if len(data) == 0:
         return
     if lookup is not None:
-        new_data = []
-        for item in data:
-            if item in lookup:
-                new_data.append(lookup[item])
-            else:
-                new_data.append(item)
+        data = [lookup.get(item, item) for item in data]
         if lookup_sort:
-            new_data.sort()
-        data = new_data
+            data.sort()
     str_data = [f'{prefix}{item}' for item in data]
+    lengths = list(map(len, str_data))
     force_output = False
     if columns is None:
-        num_columns = math.ceil(len(str_data)/minimum_lines)
+        num_columns = (len(str_data) + minimum_lines - 1) // minimum_lines
+        # Every column is at least as wide as our shortest item, and one of
+        # them has to hold the longest, so anything more than this many
+        # columns can't possibly fit.  No need to try those.
+        step = min(lengths) + len(padding)
+        if num_columns > 1 and step > 0:
+            most_columns = 1 + (max_width - len(indent) - max(lengths)) // step
+            num_columns = max(1, min(num_columns, most_columns))
     else:
         num_columns = columns
         force_output = True
 
+    # Single-column output doesn't need any of the fitting logic below.  That
+    # covers both being forced to a single column, and having few enough
+    # items that we'd never have gone multi-column in the first place.
+    if num_columns == 1:
+        width = max(lengths)
+        print('\n'.join([indent + item.ljust(width) for item in str_data]))
+        return
+
     # There might be a better way to do this, but what we're doing is starting
     # at our "ideal" column number, seeing if it fits in our max_width, and
     # then decreasing by one until it actually fits.  We could, instead, take
     # a look at the max length overall and base stuff on that, or take an
     # average and hope for the best, but the upside is that this *will* give
     # us the most number of columns we can fit for the data, if need be.
+    # The widths are computed from `lengths` alone, so we only build the
+    # actual columns once we know they'll fit.
     while True:
         max_widths = [0]*num_columns
-        cols = list(column_chunks(str_data, num_columns))
-        for idx, col in enumerate(cols):
-            for item in col:
-                max_widths[idx] = max(max_widths[idx], len(item))
+        # Items per column (ceiling division)
+        n = (len(lengths) + num_columns - 1) // num_columns
+        for idx, start in enumerate(range(0, len(lengths), n)):
+            max_widths[idx] = max(lengths[start:start+n])
         total_width = len(indent) + sum(max_widths) + (len(padding)*(num_columns-1))
         if force_output or total_width <= max_width or num_columns == 1:
-            format_str = '{}{}'.format(
-                    indent,
-                    padding.join([f'{{:<{l}}}' for l in max_widths]),
-                    )
-            for row_data in itertools.zip_longest(*cols, fillvalue=''):
-                print(format_str.format(*row_data))
+            cols = [str_data[start:start+n] for start in range(0, len(str_data), n)]
+            # Pad everything out to its column width (and pad out any short
+            # columns with blanks) up-front, so each row is just a join.
+            num_rows = len(cols[0])
+            padded_cols = [
+                    [item.ljust(width) for item in col] + [' '*width]*(num_rows-len(col))
+                    for col, width in zip(cols, max_widths)
+                    ]
+            print('\n'.join([
+                indent + padding.join(row_data)
+                for row_data in zip(*padded_cols)
+                ]))
             break
         else:
             num_columns -= 1
@@ -154,15 +174,14 @@ class FlexiListAction(argparse.Action):
         if not isinstance(arg_value, list):
             arg_value = []
 
-        # Check for `list`
-        if 'list' in arg_value:
+        # Check for `list`.  Once that's been seen, the list is only ever
+        # exactly `['list']`, so there's no need to scan the whole thing.
+        if arg_value == ['list']:
             return
 
-        # Split the given arg, if necessary
-        if ',' in this_value:
-            values = [v.strip() for v in this_value.split(',')]
-        else:
-            values = [this_value.strip()]
+        # Split the given arg (a value without commas just ends up as a
+        # single-element list)
+        values = [v.strip() for v in this_value.split(',')]
 
         # Check to see if `list` or `help` was specified.  If so,
         # trim it down, otherwise add the new values.
@@ -194,11 +213,9 @@ class FlexiSetAction(argparse.Action):
         if 'list' in arg_value:
             return
 
-        # Split the given arg, if necessary
-        if ',' in this_value:
-            values = set([v.strip() for v in this_value.split(',')])
-        else:
-            values = {this_value.strip()}
+        # Split the given arg (a value without commas just ends up as a
+        # single-element set)
+        values = {v.strip() for v in this_value.split(',')}
 
         # Check to see if `list` or `help` was specified.  If so,
         # trim it down, otherwise add the new values.
@@ -230,11 +247,9 @@ class FlexiSetAllAction(argparse.Action):
         if 'list' in arg_value:
             return
 
-        # Split the given arg, if necessary
-        if ',' in this_value:
-            values = set([v.strip() for v in this_value.split(',')])
-        else:
-            values = {this_value.strip()}
+        # Split the given arg (a value without commas just ends up as a
+        # single-element set)
+        values = {v.strip() for v in this_value.split(',')}
 
         # Check to see if `list` or `help` was specified.  If so,
         # trim it down, otherwise add the new values.
@@ -298,25 +313,38 @@ class GameDataLookup:
                             break
 
 
+    @functools.cached_property
+    def dump_lines(self):
+        """
+        The lines of text which make up our dump, as a tuple.  Our
+        lookups are static, so this only needs to be built (and sorted) once.
+        """
+        header = f'Valid {self.label}'
+        lines = [header, '-'*len(header), '']
+        for name, obj in sorted(self.lookup.items()):
+            if name == obj.label:
+                lines.append(f' - {name}')
+            else:
+                lines.append(f' - {name}: {obj.label}')
+        for extra in sorted(self.acceptable_extras):
+            lines.append(f' - {extra}')
+        lines.append('')
+        return tuple(lines)
+
+
     def show(self, force=False):
         if force or self.needs_dump:
-            header = f'Valid {self.label}'
-            print(header)
-            print('-'*len(header))
-            print('')
-            for name, obj in sorted(self.lookup.items()):
-                if name == obj.label:
-                    print(f' - {name}')
-                else:
-                    print(f' - {name}: {obj.label}')
-            for extra in sorted(self.acceptable_extras):
-                print(f' - {extra}')
-            print('')
+            print('\n'.join(self.dump_lines))
             return True
         return False
 
 
-def main():
+@functools.lru_cache(maxsize=1)
+def build_parser():
+    """
+    Builds our ArgumentParser.  This only ever gets built once, even if
+    `main()` is called more than once.
+    """
 
     parser = argparse.ArgumentParser(
             description=f'SteamWorld Heist II CLI Save Editor v{__version__}',
@@ -795,8 +823,22 @@ def main():
             help='Fully hides the world map (respawns clouds)',
             )
 
+    return parser
+
+
+def main():
+
+    parser = build_parser()
     args = parser.parse_args()
 
+    # The game data (and the savefile parsing code below) is only imported
+    # once we know we'll need it, so `--help` and argument errors don't have
+    # to pay to load it all.
+    from .gamedata import (
+            XP, JOBS, CREW, CREW_REAL, WEAPONS, UTILITIES,
+            SHIP_EQUIPMENT, KEY_ITEMS, UPGRADES, HATS,
+            )
+
     ###
     ### Some basic argument cleanup
     ###
@@ -854,13 +896,13 @@ def main():
 
     # Process global/full unlocks for key items
     if args.unlock_key_items:
-        args.add_key_item |= set(KEY_ITEMS.keys())
+        args.add_key_item.update(KEY_ITEMS.keys())
         user_add_key_item = True
 
     # Process global/full unlocks for upgrades, and also
     # some predefined subsets
     if args.unlock_upgrades:
-        args.add_upgrade |= set(UPGRADES.keys())
+        args.add_upgrade.update(UPGRADES.keys())
         user_add_upgrade = True
         args.unlock_personal_upgrades = True
     else:
@@ -1069,6 +1111,8 @@ def main():
     ###
 
     # Load in the savefile
+    from .datafile import StringStorage
+    from .savefile import Savefile, InventoryItem, InMissionSavegameException
     try:
         save = Savefile(args.filename,
                 error_save_to=args.error_save_to,
@@ -1084,12 +1128,22 @@ def main():
     # Now decide what to do.  First up: listing contents!
     if args.list:
 
-        print(f'Savefile Version: {save.version}')
-        print('General Game Information:')
-        print(f' - Day: {save.imh2.days_elapsed+1}')
-        print(f' - Water (money): {save.resources.water}')
-        print(f' - Fragments: {save.resources.fragments}')
-        print(f'Crew Unlocked: {len(save.header.crew)}')
+        # Bits of the save we refer to more than once
+        ship_upgrades = save.ship.upgrades
+        equipped = save.ship.equipped
+        inventory_items = save.inventory.items
+        hats = save.inventory.hats
+
+        # The general info up top can all go out in one go; everything after
+        # this gets interleaved with print_columns calls.
+        print('\n'.join([
+            f'Savefile Version: {save.version}',
+            'General Game Information:',
+            f' - Day: {save.imh2.days_elapsed+1}',
+            f' - Water (money): {save.resources.water}',
+            f' - Fragments: {save.resources.fragments}',
+            f'Crew Unlocked: {len(save.header.crew)}',
+            ]))
         crew_report = {}
         for crew in save.crew:
             if crew.name == 'crew_captain_final_boss' or crew.name == 'crew_captain_rearmed_combat':
@@ -1118,7 +1172,7 @@ def main():
                     )
             if crew.reserve_xp > 0:
                 print(f'   - Reserve XP: {crew.reserve_xp}')
-        print(f'Unlocked Sub Upgrades: {len(save.ship.upgrades)}/{len(UPGRADES)}')
+        print(f'Unlocked Sub Upgrades: {len(ship_upgrades)}/{len(UPGRADES)}')
         if args.verbose:
             upgrade_mapping = {
                     'main' : 'Main',
@@ -1130,7 +1184,7 @@ def main():
                     'Item': [],
                     'Job': [],
                     }
-            for upgrade_str in save.ship.upgrades:
+            for upgrade_str in ship_upgrades:
                 # Not doing a more thorough check to see if we've got a valid
                 # category since that's already been done with verifying the
                 # gamedata generation.
@@ -1145,12 +1199,12 @@ def main():
                             lookup_sort=True,
                             indent='   ',
                             )
-        print(f'Equipped Sub Equipment: {len(save.ship.equipped)}')
+        print(f'Equipped Sub Equipment: {len(equipped)}')
         if args.verbose:
             # Not sorting this one since it's a short enough list; that way it should match what shows
             # up in-game.
-            print_columns(save.ship.equipped, columns=columns, lookup=SHIP_EQUIPMENT)
-        print(f'Items in inventory: {len(save.inventory.items)}')
+            print_columns(equipped, columns=columns, lookup=SHIP_EQUIPMENT)
+        print(f'Items in inventory: {len(inventory_items)}')
         if args.verbose:
             # Gonna sort these into categories for ease of browsing.
             lookups = {
@@ -1167,11 +1221,15 @@ def main():
                     'Key Items': [],
                     'Other': [],
                     }
-            for item in save.inventory.items:
-                for category, lookup in lookups.items():
-                    if category == 'Other' or item.name in lookup:
-                        categorized[category].append(item.name)
-                        break
+            # Reverse index of item name to category, so each item only needs
+            # a single lookup.  Earlier categories win if a name somehow shows
+            # up in more than one.
+            item_categories = {}
+            for category, lookup in lookups.items():
+                for name in lookup:
+                    item_categories.setdefault(name, category)
+            for item in inventory_items:
+                categorized[item_categories.get(item.name, 'Other')].append(item.name)
             for category, items in categorized.items():
                 if len(items) > 0:
                     print(f' - {category} ({len(items)}):')
@@ -1182,9 +1240,9 @@ def main():
                             lookup_sort=True,
                             indent='   ',
                             )
-        print(f'Unlocked hats: {len(save.inventory.hats)}/{len(HATS)}')
+        print(f'Unlocked hats: {len(hats)}/{len(HATS)}')
         if args.verbose:
-            print_columns(sorted(save.inventory.hats), columns=columns, lookup=HATS, lookup_sort=True)
+            print_columns(sorted(hats), columns=columns, lookup=HATS, lookup_sort=True)
 
     # If we get here, just checking to make sure our parsing works!
     # (That's technically already done by this point; we're just checking to
@@ -1196,22 +1254,19 @@ def main():
             # Print the next bunch of data we haven't parsed yet.
             per_line = 16
             lines = 5
-            printable_chars = b'0123456789abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ!"#$%&\'()*+,-./:;<=>?@[\\]^_`{|}~ '
+            dump_lines = []
             for line in range(lines):
                 start = save.remaining.start_pos + (line*per_line)
-                print('0x{:08X}  '.format(start), end='')
-                for (idx, byte) in enumerate(save.data[start:start+per_line]):
-                    print('{:02X}'.format(byte), end='')
-                    print(' ', end='')
-                    if idx % 4 == 3:
-                        print(' ', end='')
-                print('| ', end='')
-                for byte in save.data[start:start+per_line]:
-                    if byte in printable_chars:
-                        print(chr(byte), end='')
-                    else:
-                        print('.', end='')
-                print('')
+                chunk = save.data[start:start+per_line]
+                # Bytes are grouped by four, with an extra space after each
+                # full group.
+                hex_part = ''.join([
+                    chunk[idx:idx+4].hex(' ').upper() + (' ' if idx+4 > len(chunk) else '  ')
+                    for idx in range(0, len(chunk), 4)
+                    ])
+                ascii_part = chunk.translate(HEXDUMP_TABLE).decode('ascii')
+                dump_lines.append(f'0x{start:08X}  {hex_part}| {ascii_part}')
+            print('\n'.join(dump_lines))
 
     # Doing a JSON dump
     elif args.json is not None:
@@ -1238,30 +1293,6 @@ def main():
     # Otherwise, we're actually making some edits, theoretically
     elif args.output:
 
-        # Print a warning, now that we're attempting to find+fix string references
-        # even in parts of the file we don't actually know how to parse yet.
-        if args.show_warning:
-            print(textwrap.dedent("""
-                    ***WARNING**
-                    Due to the nature of the savegame format, and the fact that this utility
-                    doesn't actually understand the entire format yet, edits performed to
-                    your savegames have a small but nonzero chance of resulting in corrupted
-                    savegames.  I believe the risk is extremely small, but keep it in mind!
-                    Even if previous similar edits have worked fine, it's possible that this
-                    could encounter an edge case which results in an invalid save file.  Keep
-                    backups of your saves, and use with caution!
-                    ***WARNING**
-                    """))
-
-        if not args.force and os.path.exists(args.output):
-            print(f'WARNING: {args.output} already exists.')
-            response = input('Overwrite (y/N)? ').strip().lower()
-            if response == '' or response[0] != 'y':
-                print('Exiting!')
-                print('')
-                return 4
-            print('')
-
         do_save = False
 
         # Show the filename again
@@ -1525,7 +1556,7 @@ def main():
 
         # New upgrades.  Note that all our keyitem mappings have already been computed
         if args.add_upgrade:
-            needed_upgrades = args.add_upgrade - set(save.ship.upgrades)
+            needed_upgrades = args.add_upgrade.difference(save.ship.upgrades)
             if len(needed_upgrades) == 0:
                 if user_add_upgrade:
                     print('- Skipping upgrade unlocks; all requested upgrades are already unlocked')
@@ -1545,7 +1576,7 @@ def main():
 
         # Removed upgrades
         if args.remove_upgrade:
-            declined_upgrades = args.remove_upgrade & set(save.ship.upgrades)
+            declined_upgrades = args.remove_upgrade.intersection(save.ship.upgrades)
             if len(declined_upgrades) == 0:
                 if user_remove_upgrade:
                     print('- Skipping upgrade removals; all requested removals are already not present')
@@ -1562,9 +1593,13 @@ def main():
                     save.ship.upgrades.remove(upgrade_name)
                 do_save = True
 
+        # Names of everything in our inventory, shared by the Key Item checks
+        # below (and kept up to date as they add/remove items)
+        inventory_names = {i.name for i in save.inventory.items}
+
         # New Key Items.  Note that all our upgrade mappings have already been computed
         if args.add_key_item:
-            needed_keyitems = args.add_key_item - set([i.name for i in save.inventory.items])
+            needed_keyitems = args.add_key_item - inventory_names
             if len(needed_keyitems) == 0:
                 if user_add_key_item:
                     print('- Skipping Key Item unlocks; all requested Key Items are already unlocked')
@@ -1577,15 +1612,19 @@ def main():
                             lookup=KEY_ITEMS,
                             lookup_sort=True,
                             )
-                for item in sorted(needed_keyitems):
-                    save.inventory.add_item(item, InventoryItem.ItemFlag.KEYITEM, flag_as_new=args.set_new_item)
+                save.inventory.add_items(
+                        [(item, 1) for item in sorted(needed_keyitems)],
+                        InventoryItem.ItemFlag.KEYITEM,
+                        flag_as_new=args.set_new_item,
+                        )
+                inventory_names |= needed_keyitems
                 do_save = True
         elif user_add_key_item:
             print('- Skipping Key Item unlocks due to other removals requested')
 
         # Removed Key Items
         if args.remove_key_item:
-            declined_items = args.remove_key_item & set([i.name for i in save.inventory.items])
+            declined_items = args.remove_key_item & inventory_names
             if len(declined_items) == 0:
                 if user_remove_key_item:
                     print('- Skipping Key Item removals; all requested removals are already not present')
@@ -1604,22 +1643,25 @@ def main():
                         to_remove_indexes.append(idx)
                 for idx in sorted(to_remove_indexes, reverse=True):
                     del save.inventory.items[idx]
+                inventory_names -= declined_items
                 do_save = True
 
         # Hats!
         if args.unlock_hats or args.add_hat:
+            # HATS.keys() supports set operations directly, and --add-hat
+            # is already a set, so neither needs copying first.
             if args.unlock_hats:
-                requested_hats = HATS.keys()
+                needed_hats = HATS.keys() - save.inventory.hats
             else:
-                requested_hats = args.add_hat
-            needed_hats = set(requested_hats) - set(save.inventory.hats)
+                needed_hats = args.add_hat.difference(save.inventory.hats)
             if len(needed_hats) == 0:
                 print(f'- Skipping hat unlocks; all requested hats are already unlocked')
             else:
                 print(f'- Unlocking {len(needed_hats)} hats')
-                save.inventory.hats.extend(sorted(needed_hats))
+                sorted_hats = sorted(needed_hats)
+                save.inventory.hats.extend(sorted_hats)
                 if args.set_new_item:
-                    save.inventory.new_hats.extend(sorted(needed_hats))
+                    save.inventory.new_hats.extend(sorted_hats)
                 do_save = True
 
         # Capt. Leeway's hat
@@ -1649,161 +1691,100 @@ def main():
         if args.endgame_ship_pack:
             to_give = [
                     # Front weapons
-                    'ship_equipment_torpedo_03',
-                    'ship_equipment_charge_laser_02',
+                    ('ship_equipment_torpedo_03', 1),
+                    ('ship_equipment_charge_laser_02', 1),
                     # Side weapons
-                    'ship_equipment_micro_torpedo_02',
-                    'ship_equipment_laser_02',
+                    ('ship_equipment_micro_torpedo_02', 1),
+                    ('ship_equipment_laser_02', 1),
                     # Top weapons
-                    'ship_equipment_torpedo_top_01',
-                    'ship_equipment_laser_top_01',
+                    ('ship_equipment_torpedo_top_01', 1),
+                    ('ship_equipment_laser_top_01', 1),
                     # Torpedo Damage
-                    'ship_equipment_module_torpedo_damage_02',
-                    'ship_equipment_module_torpedo_damage_02',
+                    ('ship_equipment_module_torpedo_damage_02', 2),
                     # Laser Damage
-                    'ship_equipment_module_laser_cooldown_rare_02',
-                    'ship_equipment_module_laser_cooldown_rare_02',
+                    ('ship_equipment_module_laser_cooldown_rare_02', 2),
                     # Health
-                    'ship_equipment_module_health_03',
-                    'ship_equipment_module_health_03',
+                    ('ship_equipment_module_health_03', 2),
                     # Speed
-                    'ship_equipment_module_speed_03',
-                    'ship_equipment_module_speed_03',
+                    ('ship_equipment_module_speed_03', 2),
                     # Air
-                    'ship_equipment_module_air_01',
+                    ('ship_equipment_module_air_01', 1),
                     ]
-            print(f'- Giving {len(to_give)} items in a ship equipment pack')
-            for item in to_give:
-                save.inventory.add_item(item, InventoryItem.ItemFlag.SHIP_EQUIPMENT, flag_as_new=args.set_new_item)
+            print(f'- Giving {sum([count for _, count in to_give])} items in a ship equipment pack')
+            save.inventory.add_items(to_give, InventoryItem.ItemFlag.SHIP_EQUIPMENT, flag_as_new=args.set_new_item)
             do_save = True
 
         # Endgame weapon pack
         if args.endgame_weapon_pack:
             to_give = [
                     # Snipers
-                    'sniper_06',
-                    'sniper_06',
-                    'sniper_05_rare',
-                    'sniper_05_rare',
+                    ('sniper_06', 2),
+                    ('sniper_05_rare', 2),
                     # SMGs (Reaper)
-                    'smg_06',
-                    'smg_06',
-                    'crossbow_05_rare',
-                    'crossbow_05_rare',
+                    ('smg_06', 2),
+                    ('crossbow_05_rare', 2),
                     # Handguns (Engineer)
-                    'handgun_06',
-                    'handgun_06',
-                    'handgun_05_rare',
-                    'handgun_05_rare',
+                    ('handgun_06', 2),
+                    ('handgun_05_rare', 2),
                     # Launchers (Boomer)
-                    'rpg_06',
-                    'rpg_06',
-                    'launcher_05_rare',
-                    'launcher_05_rare',
+                    ('rpg_06', 2),
+                    ('launcher_05_rare', 2),
                     # Hammers (Brawler)
-                    'hammer_06',
-                    'hammer_06',
-                    'hammer_05_rare',
-                    'hammer_05_rare',
+                    ('hammer_06', 2),
+                    ('hammer_05_rare', 2),
                     # Shotguns (Flanker)
-                    'shotgun_06',
-                    'shotgun_06',
-                    'shotgun_05_rare',
-                    'shotgun_05_rare',
+                    ('shotgun_06', 2),
+                    ('shotgun_05_rare', 2),
                     ]
-            print(f'- Giving {len(to_give)} items in a weapon equipment pack')
-            for item in to_give:
-                save.inventory.add_item(item, InventoryItem.ItemFlag.WEAPON, flag_as_new=args.set_new_item)
+            print(f'- Giving {sum([count for _, count in to_give])} items in a weapon equipment pack')
+            save.inventory.add_items(to_give, InventoryItem.ItemFlag.WEAPON, flag_as_new=args.set_new_item)
             do_save = True
 
         # Endgame utility equipment pack
         if args.endgame_utility_pack:
             to_give = [
                     # Repair
-                    'utility_repair_03',
-                    'utility_repair_03',
-                    'utility_repair_03_rare',
-                    'utility_repair_03_rare',
-                    'utility_stimpack_rare',
-                    'utility_stimpack_rare',
+                    ('utility_repair_03', 2),
+                    ('utility_repair_03_rare', 2),
+                    ('utility_stimpack_rare', 2),
                     # Armor
-                    'utility_armor_03',
-                    'utility_armor_03',
-                    'utility_armor_03',
-                    'utility_armor_03',
-                    'utility_alloy_rare',
-                    'utility_alloy_rare',
-                    'utility_alloy_rare',
-                    'utility_alloy_rare',
+                    ('utility_armor_03', 4),
+                    ('utility_alloy_rare', 4),
                     # Grenades / Rockets
-                    'utility_grenade_06_rare',
-                    'utility_grenade_06_rare',
-                    'utility_rocket_02_rare',
-                    'utility_rocket_02_rare',
+                    ('utility_grenade_06_rare', 2),
+                    ('utility_rocket_02_rare', 2),
                     # Sidearms
-                    'utility_sidearm_05_rare',
-                    'utility_sidearm_05_rare',
-                    'utility_sidearm_06_rare',
-                    'utility_sidearm_06_rare',
+                    ('utility_sidearm_05_rare', 2),
+                    ('utility_sidearm_06_rare', 2),
                     # Weapon Chargers
-                    'utility_weapon_charger',
-                    'utility_weapon_charger',
+                    ('utility_weapon_charger', 2),
                     # Knuckles
-                    'utility_knuckle_02',
-                    'utility_knuckle_02',
+                    ('utility_knuckle_02', 2),
                     # Boots / Movement
-                    'utility_boots_03_rare',
-                    'utility_boots_03_rare',
-                    'utility_boots_03_rare',
-                    'utility_boots_03_rare',
-                    'utility_boots_fireproof',
-                    'utility_boots_fireproof',
-                    'utility_boots_warm',
-                    'utility_boots_warm',
-                    'utility_boots_crippleproof',
-                    'utility_boots_crippleproof',
-                    'utility_jetpack',
-                    'utility_jetpack',
-                    'utility_jetpack',
-                    'utility_jetpack',
+                    ('utility_boots_03_rare', 4),
+                    ('utility_boots_fireproof', 2),
+                    ('utility_boots_warm', 2),
+                    ('utility_boots_crippleproof', 2),
+                    ('utility_jetpack', 4),
                     # Crit / Sniper Tools
-                    'utility_crit_plus_1',
-                    'utility_crit_plus_1',
-                    'utility_scope_02_rare',
-                    'utility_scope_02_rare',
-                    'utility_scope_03',
-                    'utility_scope_03',
-                    'utility_goggles_02_rare',
-                    'utility_goggles_02_rare',
+                    ('utility_crit_plus_1', 2),
+                    ('utility_scope_02_rare', 2),
+                    ('utility_scope_03', 2),
+                    ('utility_goggles_02_rare', 2),
                     # Cogs
-                    'utility_cogs_03',
-                    'utility_cogs_03',
-                    'utility_cogs_03',
-                    'utility_cogs_03',
+                    ('utility_cogs_03', 4),
                     # Aura / Radiance
-                    'utility_aura_plus_rare',
-                    'utility_aura_plus_rare',
-                    'utility_radiance_rare',
-                    'utility_radiance_rare',
+                    ('utility_aura_plus_rare', 2),
+                    ('utility_radiance_rare', 2),
                     # Damage
-                    'utility_damage_rare',
-                    'utility_damage_rare',
-                    'utility_damage_rare',
-                    'utility_damage_rare',
+                    ('utility_damage_rare', 4),
                     # Cooldowns
-                    'utility_cool_rare',
-                    'utility_cool_rare',
-                    'utility_cool_rare',
-                    'utility_cool_rare',
+                    ('utility_cool_rare', 4),
                     # XP
-                    'utility_experience_badge_02_rare',
-                    'utility_experience_badge_02_rare',
-                    'utility_experience_badge_02_rare',
-                    'utility_experience_badge_02_rare',
+                    ('utility_experience_badge_02_rare', 4),
                     ]
-            print(f'- Giving {len(to_give)} items in a utility equipment pack')
-            for item in to_give:
-                save.inventory.add_item(item, InventoryItem.ItemFlag.UTILITY, flag_as_new=args.set_new_item)
+            print(f'- Giving {sum([count for _, count in to_give])} items in a utility equipment pack')
+            save.inventory.add_items(to_give, InventoryItem.ItemFlag.UTILITY, flag_as_new=args.set_new_item)
             do_save = True
 
         # Reveal map
@@ -1834,6 +1815,23 @@ def main():
 
         # Save out, assuming we did anything
         if do_save:
+
+            # Print a warning, now that we're attempting to find+fix string references
+            # even in parts of the file we don't actually know how to parse yet.
+            # This (and the overwrite check) waits until we know there's
+            # something to write, so no-op runs don't bother with either.
+            if args.show_warning:
+                print(EDIT_WARNING)
+
+            if not args.force and os.path.exists(args.output):
+                print(f'WARNING: {args.output} already exists.')
+                response = input('Overwrite (y/N)? ').strip().lower()
+                if response == '' or response[0] != 'y':
+                    print('Exiting!')
+                    print('')
+                    return 4
+                print('')
+
             if args.strings_expanded:
                 string_mode = StringStorage.EXPANDED
             elif args.strings_compressed:
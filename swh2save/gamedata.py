@@ -17,27 +17,87 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>
 
+import collections.abc
+
 
 class GameData:
 
     def __init__(self, name, label):
         self.name = name
         self.label = label
+        # Casefolded label, used for sorting
+        self._sort_key = label.casefold()
 
     def __str__(self):
         return f'{self.label} ({self.name})'
 
     def __lt__(self, other):
         if isinstance(other, GameData):
-            return self.label.casefold() < other.label.casefold()
+            return self._sort_key < other._sort_key
         else:
-            return self.label.casefold() < other.casefold()
+            return self._sort_key < other.casefold()
 
     def __gt__(self, other):
         if isinstance(other, GameData):
-            return self.label.casefold() > other.label.casefold()
+            return self._sort_key > other._sort_key
         else:
-            return self.label.casefold() > other.casefold()
+            return self._sort_key > other.casefold()
+
+
+class AliasMap(collections.abc.Mapping):
+    """
+    Read-only mapping which lets objects be looked up either by their real
+    name (in `real`), or by any of the aliases in `aliases`, which map from
+    the alias to the real name.  Saves us from having to store a second
+    full copy of the dict just to support the in-game names.
+    """
+
+    def __init__(self, real, aliases):
+        self.real = real
+        self.aliases = aliases
+
+    def __getitem__(self, key):
+        try:
+            return self.real[key]
+        except KeyError:
+            return self.real[self.aliases[key]]
+
+    def __iter__(self):
+        yield from self.real
+        yield from self.aliases
+
+    def __len__(self):
+        return len(self.real) + len(self.aliases)
+
+
+class LazyMap(collections.abc.Mapping):
+    """
+    Read-only mapping which holds the raw constructor arguments for a bunch
+    of GameData objects (everything but the name, which is the key), and
+    only builds each object the first time it's asked for.  Most runs of
+    the editor only ever touch a handful of these.
+    """
+
+    def __init__(self, cls, data):
+        self.cls = cls
+        self.data = data
+        self.cache = {}
+
+    def __getitem__(self, key):
+        obj = self.cache.get(key)
+        if obj is None:
+            obj = self.cls(key, *self.data[key])
+            self.cache[key] = obj
+        return obj
+
+    def __contains__(self, key):
+        return key in self.data
+
+    def __iter__(self):
+        return iter(self.data)
+
+    def __len__(self):
+        return len(self.data)
 
 
 class Experience:
@@ -51,17 +111,13 @@ class Experience:
         `xp_reqs` should be a list of the XP values required to unlock the
         various levels
         """
-        self.xp_to_level = {}
-        self.level_to_xp = {}
-        for level, xp_req in enumerate(xp_reqs):
-            self.xp_to_level[xp_req] = level
-            self.level_to_xp[level] = xp_req
-            self.max_xp = xp_req
-            self.max_level = level
+        self.level_to_xp = list(xp_reqs)
+        self.max_xp = self.level_to_xp[-1]
+        self.max_level = len(self.level_to_xp)-1
 
 
     def __len__(self):
-        return len(self.xp_to_level)
+        return len(self.level_to_xp)
 
 
 class Job(GameData):
@@ -118,10 +174,9 @@ class Utility(GameData):
 
 XP = Experience([0, 10, 30, 70, 130, 210])
 
-JOBS_REAL = {
-        'tank': Job(
-            'tank',
-            "Brawler",
+JOBS_REAL = LazyMap(Job, {
+        'tank': (
+            'Brawler',
             [
                 [
                     'vampire',
@@ -149,9 +204,8 @@ JOBS_REAL = {
                     ],
                 ],
             ),
-        'boomer': Job(
-            'boomer',
-            "Boomer",
+        'boomer': (
+            'Boomer',
             [
                 [
                     'explode_cover',
@@ -178,9 +232,8 @@ JOBS_REAL = {
                     ],
                 ],
             ),
-        'engineer': Job(
-            'engineer',
-            "Engineer",
+        'engineer': (
+            'Engineer',
             [
                 [
                     'break',
@@ -208,9 +261,8 @@ JOBS_REAL = {
                     ],
                 ],
             ),
-        'sniper': Job(
-            'sniper',
-            "Sniper",
+        'sniper': (
+            'Sniper',
             [
                 [
                     'power_shot',
@@ -237,9 +289,8 @@ JOBS_REAL = {
                     ],
                 ],
             ),
-        'hunter': Job(
-            'hunter',
-            "Reaper",
+        'hunter': (
+            'Reaper',
             [
                 [
                     'kill_shot',
@@ -266,9 +317,8 @@ JOBS_REAL = {
                     ],
                 ],
             ),
-        'flanker': Job(
-            'flanker',
-            "Flanker",
+        'flanker': (
+            'Flanker',
             [
                 [
                     'wheel_n_deal',
@@ -297,1769 +347,1384 @@ JOBS_REAL = {
                     ],
                 ],
             ),
-        }
+        })
 
-JOBS = {
-        'tank': JOBS_REAL['tank'],
-        'brawler': JOBS_REAL['tank'],
-        'boomer': JOBS_REAL['boomer'],
-        'engineer': JOBS_REAL['engineer'],
-        'sniper': JOBS_REAL['sniper'],
-        'hunter': JOBS_REAL['hunter'],
-        'reaper': JOBS_REAL['hunter'],
-        'flanker': JOBS_REAL['flanker'],
-        }
+JOBS = AliasMap(JOBS_REAL, {
+        'brawler': 'tank',
+        'reaper': 'hunter',
+        })
 
-WEAPONS = {
-        'sniper_00': Weapon(
-            'sniper_00',
-            "Junk Sniper",
+WEAPONS = LazyMap(Weapon, {
+        'sniper_00': (
+            'Junk Sniper',
             JOBS['sniper'],
             ),
-        'sniper_01': Weapon(
-            'sniper_01',
-            "Sniper Mk I",
+        'sniper_01': (
+            'Sniper Mk I',
             JOBS['sniper'],
             ),
-        'sniper_01_rare': Weapon(
-            'sniper_01_rare',
-            "Skelectric",
+        'sniper_01_rare': (
+            'Skelectric',
             JOBS['sniper'],
             ),
-        'sniper_02': Weapon(
-            'sniper_02',
-            "Sniper Mk II",
+        'sniper_02': (
+            'Sniper Mk II',
             JOBS['sniper'],
             ),
-        'sniper_02_rare': Weapon(
-            'sniper_02_rare',
-            "Blue Steel",
+        'sniper_02_rare': (
+            'Blue Steel',
             JOBS['sniper'],
             ),
-        'sniper_03': Weapon(
-            'sniper_03',
-            "Sniper Mk III",
+        'sniper_03': (
+            'Sniper Mk III',
             JOBS['sniper'],
             ),
-        'sniper_03_rare': Weapon(
-            'sniper_03_rare',
-            "Deliverance",
+        'sniper_03_rare': (
+            'Deliverance',
             JOBS['sniper'],
             ),
-        'sniper_04': Weapon(
-            'sniper_04',
-            "Sniper Mk IV",
+        'sniper_04': (
+            'Sniper Mk IV',
             JOBS['sniper'],
             ),
-        'sniper_04_rare': Weapon(
-            'sniper_04_rare',
-            "Deadshot",
+        'sniper_04_rare': (
+            'Deadshot',
             JOBS['sniper'],
             ),
-        'sniper_05': Weapon(
-            'sniper_05',
-            "Sniper Mk V",
+        'sniper_05': (
+            'Sniper Mk V',
             JOBS['sniper'],
             ),
-        'sniper_05_rare': Weapon(
-            'sniper_05_rare',
-            "Matchstick",
+        'sniper_05_rare': (
+            'Matchstick',
             JOBS['sniper'],
             ),
-        'sniper_06': Weapon(
-            'sniper_06',
-            "Atomic Sniper Rifle",
+        'sniper_06': (
+            'Atomic Sniper Rifle',
             JOBS['sniper'],
             ),
-        'smg_00': Weapon(
-            'smg_00',
-            "Old SMG",
+        'smg_00': (
+            'Old SMG',
             JOBS['hunter'],
             ),
-        'smg_01': Weapon(
-            'smg_01',
-            "SMG Mk I",
+        'smg_01': (
+            'SMG Mk I',
             JOBS['hunter'],
             ),
-        'crossbow_01_rare': Weapon(
-            'crossbow_01_rare',
-            "Crossbow",
+        'crossbow_01_rare': (
+            'Crossbow',
             JOBS['hunter'],
             ),
-        'smg_02': Weapon(
-            'smg_02',
-            "SMG Mk II",
+        'smg_02': (
+            'SMG Mk II',
             JOBS['hunter'],
             ),
-        'smg_02_rare': Weapon(
-            'smg_02_rare',
-            "The Visitor",
+        'smg_02_rare': (
+            'The Visitor',
             JOBS['hunter'],
             ),
-        'smg_03': Weapon(
-            'smg_03',
-            "SMG Mk III",
+        'smg_03': (
+            'SMG Mk III',
             JOBS['hunter'],
             ),
-        'crossbow_03_rare': Weapon(
-            'crossbow_03_rare',
-            "The Stapler",
+        'crossbow_03_rare': (
+            'The Stapler',
             JOBS['hunter'],
             ),
-        'smg_04': Weapon(
-            'smg_04',
-            "SMG Mk IV",
+        'smg_04': (
+            'SMG Mk IV',
             JOBS['hunter'],
             ),
-        'smg_04_rare': Weapon(
-            'smg_04_rare',
-            "Chrono Blaster",
+        'smg_04_rare': (
+            'Chrono Blaster',
             JOBS['hunter'],
             ),
-        'smg_05': Weapon(
-            'smg_05',
-            "SMG Mk V",
+        'smg_05': (
+            'SMG Mk V',
             JOBS['hunter'],
             ),
-        'crossbow_05_rare': Weapon(
-            'crossbow_05_rare',
-            "Siphoning Crossbow",
+        'crossbow_05_rare': (
+            'Siphoning Crossbow',
             JOBS['hunter'],
             ),
-        'smg_06': Weapon(
-            'smg_06',
-            "Atomic SMG",
+        'smg_06': (
+            'Atomic SMG',
             JOBS['hunter'],
             ),
-        'handgun_00': Weapon(
-            'handgun_00',
-            "Antique Carrion Pistol",
+        'handgun_00': (
+            'Antique Carrion Pistol',
             JOBS['engineer'],
             ),
-        'handgun_01': Weapon(
-            'handgun_01',
-            "Handgun Mk I",
+        'handgun_01': (
+            'Handgun Mk I',
             JOBS['engineer'],
             ),
-        'handgun_01_rare': Weapon(
-            'handgun_01_rare',
+        'handgun_01_rare': (
             "Aggie's Special",
             JOBS['engineer'],
             ),
-        'handgun_02': Weapon(
-            'handgun_02',
-            "Handgun Mk II",
+        'handgun_02': (
+            'Handgun Mk II',
             JOBS['engineer'],
             ),
-        'handgun_02_rare': Weapon(
-            'handgun_02_rare',
-            "Holepuncher",
+        'handgun_02_rare': (
+            'Holepuncher',
             JOBS['engineer'],
             ),
-        'handgun_03': Weapon(
-            'handgun_03',
-            "Handgun Mk III",
+        'handgun_03': (
+            'Handgun Mk III',
             JOBS['engineer'],
             ),
-        'handgun_03_rare': Weapon(
-            'handgun_03_rare',
-            "Hexed Aura Gun",
+        'handgun_03_rare': (
+            'Hexed Aura Gun',
             JOBS['engineer'],
             ),
-        'handgun_04': Weapon(
-            'handgun_04',
-            "Handgun Mk IV",
+        'handgun_04': (
+            'Handgun Mk IV',
             JOBS['engineer'],
             ),
-        'handgun_04_rare': Weapon(
-            'handgun_04_rare',
-            "Tri-Shooter",
+        'handgun_04_rare': (
+            'Tri-Shooter',
             JOBS['engineer'],
             ),
-        'handgun_05': Weapon(
-            'handgun_05',
-            "Handgun Mk V",
+        'handgun_05': (
+            'Handgun Mk V',
             JOBS['engineer'],
             ),
-        'handgun_05_rare': Weapon(
-            'handgun_05_rare',
-            "Piercing Handgun",
+        'handgun_05_rare': (
+            'Piercing Handgun',
             JOBS['engineer'],
             ),
-        'handgun_06': Weapon(
-            'handgun_06',
-            "Atomic Handgun",
+        'handgun_06': (
+            'Atomic Handgun',
             JOBS['engineer'],
             ),
-        'handgun_captain': Weapon(
-            'handgun_captain',
+        'handgun_captain': (
             "Leeway's Handgun",
             JOBS['engineer'],
             ),
-        'rpg_00': Weapon(
-            'rpg_00',
-            "Antique Rocket Launcher",
+        'rpg_00': (
+            'Antique Rocket Launcher',
             JOBS['boomer'],
             ),
-        'rpg_01': Weapon(
-            'rpg_01',
-            "Rocket Launcher Mk I",
+        'rpg_01': (
+            'Rocket Launcher Mk I',
             JOBS['boomer'],
             ),
-        'launcher_01_rare': Weapon(
-            'launcher_01_rare',
+        'launcher_01_rare': (
             "Queen's Launcher",
             JOBS['boomer'],
             ),
-        'rpg_02': Weapon(
-            'rpg_02',
-            "Rocket Launcher Mk II",
+        'rpg_02': (
+            'Rocket Launcher Mk II',
             JOBS['boomer'],
             ),
-        'rpg_02_rare': Weapon(
-            'rpg_02_rare',
-            "Rampage",
+        'rpg_02_rare': (
+            'Rampage',
             JOBS['boomer'],
             ),
-        'rpg_03': Weapon(
-            'rpg_03',
-            "Rocket Launcher Mk III",
+        'rpg_03': (
+            'Rocket Launcher Mk III',
             JOBS['boomer'],
             ),
-        'launcher_03_rare': Weapon(
-            'launcher_03_rare',
-            "Big B.",
+        'launcher_03_rare': (
+            'Big B.',
             JOBS['boomer'],
             ),
-        'rpg_04': Weapon(
-            'rpg_04',
-            "Rocket Launcher Mk IV",
+        'rpg_04': (
+            'Rocket Launcher Mk IV',
             JOBS['boomer'],
             ),
-        'rpg_04_rare': Weapon(
-            'rpg_04_rare',
-            "The Laser Pointer",
+        'rpg_04_rare': (
+            'The Laser Pointer',
             JOBS['boomer'],
             ),
-        'rpg_05': Weapon(
-            'rpg_05',
-            "Rocket Launcher Mk V",
+        'rpg_05': (
+            'Rocket Launcher Mk V',
             JOBS['boomer'],
             ),
-        'launcher_05_rare': Weapon(
-            'launcher_05_rare',
-            "Burning Grenade Launcher",
+        'launcher_05_rare': (
+            'Burning Grenade Launcher',
             JOBS['boomer'],
             ),
-        'rpg_06': Weapon(
-            'rpg_06',
-            "Atomic Launcher",
+        'rpg_06': (
+            'Atomic Launcher',
             JOBS['boomer'],
             ),
-        'hammer_00': Weapon(
-            'hammer_00',
-            "Old Hammer",
+        'hammer_00': (
+            'Old Hammer',
             JOBS['tank'],
             ),
-        'hammer_01': Weapon(
-            'hammer_01',
-            "Hammer Mk I",
+        'hammer_01': (
+            'Hammer Mk I',
             JOBS['tank'],
             ),
-        'hammer_01_rare': Weapon(
-            'hammer_01_rare',
-            "Point Break",
+        'hammer_01_rare': (
+            'Point Break',
             JOBS['tank'],
             ),
-        'hammer_02': Weapon(
-            'hammer_02',
-            "Hammer Mk II",
+        'hammer_02': (
+            'Hammer Mk II',
             JOBS['tank'],
             ),
-        'hammer_02_rare': Weapon(
-            'hammer_02_rare',
-            "Sunderer",
+        'hammer_02_rare': (
+            'Sunderer',
             JOBS['tank'],
             ),
-        'hammer_03': Weapon(
-            'hammer_03',
-            "Hammer Mk III",
+        'hammer_03': (
+            'Hammer Mk III',
             JOBS['tank'],
             ),
-        'hammer_03_rare': Weapon(
-            'hammer_03_rare',
-            "Razor Gear",
+        'hammer_03_rare': (
+            'Razor Gear',
             JOBS['tank'],
             ),
-        'hammer_04': Weapon(
-            'hammer_04',
-            "Hammer Mk IV",
+        'hammer_04': (
+            'Hammer Mk IV',
             JOBS['tank'],
             ),
-        'hammer_04_rare': Weapon(
-            'hammer_04_rare',
-            "Mjölner",
+        'hammer_04_rare': (
+            'Mjölner',
             JOBS['tank'],
             ),
-        'hammer_05': Weapon(
-            'hammer_05',
-            "Hammer Mk V",
+        'hammer_05': (
+            'Hammer Mk V',
             JOBS['tank'],
             ),
-        'hammer_05_rare': Weapon(
-            'hammer_05_rare',
-            "The Spartan",
+        'hammer_05_rare': (
+            'The Spartan',
             JOBS['tank'],
             ),
-        'hammer_06': Weapon(
-            'hammer_06',
-            "Atomic Hammer",
+        'hammer_06': (
+            'Atomic Hammer',
             JOBS['tank'],
             ),
-        'shotgun_00': Weapon(
-            'shotgun_00',
-            "Junkyard Shotgun",
+        'shotgun_00': (
+            'Junkyard Shotgun',
             JOBS['flanker'],
             ),
-        'shotgun_01': Weapon(
-            'shotgun_01',
-            "Shotgun Mk I",
+        'shotgun_01': (
+            'Shotgun Mk I',
             JOBS['flanker'],
             ),
-        'shotgun_01_rare': Weapon(
-            'shotgun_01_rare',
-            "Double Shotgun",
+        'shotgun_01_rare': (
+            'Double Shotgun',
             JOBS['flanker'],
             ),
-        'shotgun_02': Weapon(
-            'shotgun_02',
-            "Shotgun Mk II",
+        'shotgun_02': (
+            'Shotgun Mk II',
             JOBS['flanker'],
             ),
-        'shotgun_02_rare': Weapon(
-            'shotgun_02_rare',
-            "Prototype Shotgun",
+        'shotgun_02_rare': (
+            'Prototype Shotgun',
             JOBS['flanker'],
             ),
-        'shotgun_03': Weapon(
-            'shotgun_03',
-            "Shotgun Mk III",
+        'shotgun_03': (
+            'Shotgun Mk III',
             JOBS['flanker'],
             ),
-        'shotgun_03_rare': Weapon(
-            'shotgun_03_rare',
-            "Discharger",
+        'shotgun_03_rare': (
+            'Discharger',
             JOBS['flanker'],
             ),
-        'shotgun_04': Weapon(
-            'shotgun_04',
-            "Shotgun Mk IV",
+        'shotgun_04': (
+            'Shotgun Mk IV',
             JOBS['flanker'],
             ),
-        'shotgun_04_rare': Weapon(
-            'shotgun_04_rare',
-            "Slugshot Tumbler",
+        'shotgun_04_rare': (
+            'Slugshot Tumbler',
             JOBS['flanker'],
             ),
-        'shotgun_05': Weapon(
-            'shotgun_05',
-            "Shotgun Mk V",
+        'shotgun_05': (
+            'Shotgun Mk V',
             JOBS['flanker'],
             ),
-        'shotgun_05_rare': Weapon(
-            'shotgun_05_rare',
-            "Squarer",
+        'shotgun_05_rare': (
+            'Squarer',
             JOBS['flanker'],
             ),
-        'shotgun_06': Weapon(
-            'shotgun_06',
-            "Atomic Shotgun",
+        'shotgun_06': (
+            'Atomic Shotgun',
             JOBS['flanker'],
             ),
-        'katana_rare': Weapon(
-            'katana_rare',
-            "Katana",
+        'katana_rare': (
+            'Katana',
             JOBS['flanker'],
             ),
-        }
+        })
 
-CREW_REAL = {
-        'daisy': Crew(
-            'daisy',
-            "Daisy",
+CREW_REAL = LazyMap(Crew, {
+        'daisy': (
+            'Daisy',
             JOBS['sniper'],
             'hat_daisy',
             ),
-        'wesley': Crew(
-            'wesley',
-            "Wesley",
+        'wesley': (
+            'Wesley',
             JOBS['hunter'],
             'hat_wesley',
             ),
-        'judy': Crew(
-            'judy',
-            "Judy",
+        'judy': (
+            'Judy',
             JOBS['boomer'],
             'hat_judy',
             ),
-        'crow': Crew(
-            'crow',
-            "Crowbar",
+        'crow': (
+            'Crowbar',
             JOBS['flanker'],
             'hat_crow',
             ),
-        'diver': Crew(
-            'diver',
-            "Sola",
+        'diver': (
+            'Sola',
             JOBS['engineer'],
             'hat_diver',
             ),
-        'poe': Crew(
-            'poe',
-            "Poe",
+        'poe': (
+            'Poe',
             JOBS['flanker'],
             'hat_poe',
             ),
-        'cornelius': Crew(
-            'cornelius',
-            "Cornelius",
+        'cornelius': (
+            'Cornelius',
             JOBS['tank'],
             'hat_cornelius',
             ),
-        'adventure_boy': Crew(
-            'adventure_boy',
-            "Tristan",
+        'adventure_boy': (
+            'Tristan',
             JOBS['engineer'],
             'hat_adventure_boy',
             ),
-        'chimney': Crew(
-            'chimney',
-            "Chimney",
+        'chimney': (
+            'Chimney',
             JOBS['tank'],
             'hat_chimney',
             ),
-        'cyclop': Crew(
-            'cyclop',
-            "Beacon",
+        'cyclop': (
+            'Beacon',
             JOBS['sniper'],
             'hat_cyclop',
             ),
-        }
+        })
 
-CREW = {
-        'daisy': CREW_REAL['daisy'],
-        'wesley': CREW_REAL['wesley'],
-        'judy': CREW_REAL['judy'],
-        'crow': CREW_REAL['crow'],
-        'crowbar': CREW_REAL['crow'],
-        'diver': CREW_REAL['diver'],
-        'sola': CREW_REAL['diver'],
-        'poe': CREW_REAL['poe'],
-        'cornelius': CREW_REAL['cornelius'],
-        'adventure_boy': CREW_REAL['adventure_boy'],
-        'tristan': CREW_REAL['adventure_boy'],
-        'chimney': CREW_REAL['chimney'],
-        'cyclop': CREW_REAL['cyclop'],
-        'beacon': CREW_REAL['cyclop'],
-        }
+CREW = AliasMap(CREW_REAL, {
+        'crowbar': 'crow',
+        'sola': 'diver',
+        'tristan': 'adventure_boy',
+        'beacon': 'cyclop',
+        })
 
-UPGRADES = {
-        'ship_boost_00': Upgrade(
-            'ship_boost_00',
-            "Propeller Booster",
-            'ship_booster',
-            'ability',
+# Sorted by label
+UPGRADES = LazyMap(Upgrade, {
+        'exp_bonus_01': (
+            'Advanced Combat Guidebook (XP Bonus)',
+            None,
+            'main',
             ),
-        'dive_00': Upgrade(
-            'dive_00',
-            "Pressure Tank",
-            'steel_plates_west_caribbea_c',
+        'celestial_gear_02': (
+            'Amethyst Gear (Move Distance)',
+            'keyitem_celestial_gear_02',
             'ability',
             ),
-        'dive_02': Upgrade(
-            'dive_02',
-            "Atomic Engine",
-            'atomic_engine',
-            'ability',
+        'jobupgrade_engineer_2': (
+            'Amped Up+',
+            None,
+            'guildhall',
             ),
-        'geiger_counter_00': Upgrade(
-            'geiger_counter_00',
-            "Geiger Counter",
-            'keyitem_geiger_counter',
+        'dive_02': (
+            'Atomic Engine',
+            'atomic_engine',
             'ability',
             ),
-        'geiger_counter_01': Upgrade(
-            'geiger_counter_01',
-            "Atomic Engine",
+        'geiger_counter_01': (
+            'Atomic Engine',
             'atomic_engine',
             'ability',
             ),
-        'equip_00': Upgrade(
-            'equip_00',
-            "Sub Equipment Terminal",
+        'jobupgrade_flanker_1': (
+            'Backbiter+',
             None,
-            'main',
+            'guildhall',
             ),
-        'gym_00': Upgrade(
-            'gym_00',
-            "Personal Upgrade Terminal",
+        'jobupgrade_engineer_3': (
+            'Break+',
             None,
-            'main',
+            'guildhall',
             ),
-        'gym_01': Upgrade(
-            'gym_01',
-            "Improved Personal Upgrades",
+        'bunk_bed_00': (
+            'Bunk Bed',
             None,
             'main',
             ),
-        'guildhall_00': Upgrade(
-            'guildhall_00',
-            "Job Upgrade Terminal",
+        'bunk_bed_01': (
+            'Bunk Bed',
             None,
             'main',
             ),
-        'guildhall_01': Upgrade(
-            'guildhall_01',
-            "Improved Job Upgrades",
+        'celestial_gear_06': (
+            'Citrine Gear (Damage)',
+            'keyitem_celestial_gear_06',
+            'ability',
+            ),
+        'exp_bonus_00': (
+            'Combat Guidebook (XP Bonus)',
             None,
             'main',
             ),
-        'guildhall_02': Upgrade(
-            'guildhall_02',
-            "Epic Job Upgrades",
+        'celestial_gear_05': (
+            'Diamond Gear (Aim)',
+            'keyitem_celestial_gear_05',
+            'ability',
+            ),
+        'crew_health_00': (
+            'Dumbbells (Health)',
             None,
             'main',
             ),
-        'equip_slot_00': Upgrade(
-            'equip_slot_00',
-            "Sub Equipment Slot",
+        'sonar': (
+            'Echo Locator',
             None,
             'main',
             ),
-        'equip_slot_01': Upgrade(
-            'equip_slot_01',
-            "Sub Equipment Slot",
+        'celestial_gear_03': (
+            'Emerald Gear (Aura, Melee Damage)',
+            'keyitem_celestial_gear_03',
+            'ability',
+            ),
+        'guildhall_02': (
+            'Epic Job Upgrades',
             None,
             'main',
             ),
-        'equip_slot_02': Upgrade(
-            'equip_slot_02',
-            "Sub Equipment Slot",
+        'extra_cog_00': (
+            'Extra Cog',
             None,
             'main',
             ),
-        'equip_slot_03': Upgrade(
-            'equip_slot_03',
-            "Sub Equipment Slot",
+        'extra_cog_01': (
+            'Extra Cog',
             None,
             'main',
             ),
-        'equip_slot_04': Upgrade(
-            'equip_slot_04',
-            "Sub Equipment Slot",
+        'extra_cog_02': (
+            'Extra Cog',
             None,
             'main',
             ),
-        'equip_slot_05': Upgrade(
-            'equip_slot_05',
-            "Sub Equipment Slot",
+        'extra_cog_03': (
+            'Extra Cog',
             None,
             'main',
             ),
-        'sonar': Upgrade(
-            'sonar',
-            "Echo Locator",
+        'jobupgrade_sniper_2': (
+            'Focus+',
             None,
-            'main',
+            'guildhall',
+            ),
+        'geiger_counter_00': (
+            'Geiger Counter',
+            'keyitem_geiger_counter',
+            'ability',
+            ),
+        'celestial_gear_01': (
+            'Golden Gear (Health)',
+            'keyitem_celestial_gear_01',
+            'ability',
             ),
-        'bunk_bed_00': Upgrade(
-            'bunk_bed_00',
-            "Bunk Bed",
+        'jobupgrade_engineer_1': (
+            'Greased Up+',
             None,
-            'main',
+            'guildhall',
             ),
-        'bunk_bed_01': Upgrade(
-            'bunk_bed_01',
-            "Bunk Bed",
+        'jobupgrade_tank_3': (
+            'Hard Shell+',
             None,
-            'main',
+            'guildhall',
             ),
-        'extra_cog_00': Upgrade(
-            'extra_cog_00',
-            "Extra Cog",
+        'jobupgrade_reaper_3': (
+            'Harvest+',
             None,
-            'main',
+            'guildhall',
             ),
-        'extra_cog_01': Upgrade(
-            'extra_cog_01',
-            "Extra Cog",
+        'crew_health_01': (
+            'Heavy Dumbbells (Health)',
             None,
             'main',
             ),
-        'extra_cog_02': Upgrade(
-            'extra_cog_02',
-            "Extra Cog",
+        'jobupgrade_boomer_1': (
+            'Hidden Explosives+',
             None,
-            'main',
+            'guildhall',
             ),
-        'extra_cog_03': Upgrade(
-            'extra_cog_03',
-            "Extra Cog",
+        'jobupgrade_sniper_3': (
+            "Hunter's Mark+",
             None,
-            'main',
+            'guildhall',
             ),
-        'extra_utility_00': Upgrade(
-            'extra_utility_00',
-            "Utility Belts",
+        'guildhall_01': (
+            'Improved Job Upgrades',
             None,
             'main',
             ),
-        'exp_bonus_00': Upgrade(
-            'exp_bonus_00',
-            "Combat Guidebook (XP Bonus)",
+        'gym_01': (
+            'Improved Personal Upgrades',
             None,
             'main',
             ),
-        'exp_bonus_01': Upgrade(
-            'exp_bonus_01',
-            "Advanced Combat Guidebook (XP Bonus)",
+        'guildhall_00': (
+            'Job Upgrade Terminal',
             None,
             'main',
             ),
-        'money_bonus_00': Upgrade(
-            'money_bonus_00',
-            "Water Purifier",
+        'jobupgrade_boomer_3': (
+            'Loose Cannon+',
             None,
-            'main',
+            'guildhall',
             ),
-        'money_bonus_01': Upgrade(
-            'money_bonus_01',
-            "Purifier Efficiency",
+        'crew_health_02': (
+            'Massive Dumbbells (Health)',
             None,
             'main',
             ),
-        'crew_health_00': Upgrade(
-            'crew_health_00',
-            "Dumbbells (Health)",
+        'jobupgrade_tank_2': (
+            'Payback+',
             None,
-            'main',
+            'guildhall',
             ),
-        'crew_health_01': Upgrade(
-            'crew_health_01',
-            "Heavy Dumbbells (Health)",
+        'gym_00': (
+            'Personal Upgrade Terminal',
             None,
             'main',
             ),
-        'crew_health_02': Upgrade(
-            'crew_health_02',
-            "Massive Dumbbells (Health)",
+        'jobupgrade_sniper_1': (
+            'Power Shot+',
             None,
-            'main',
+            'guildhall',
+            ),
+        'dive_00': (
+            'Pressure Tank',
+            'steel_plates_west_caribbea_c',
+            'ability',
             ),
-        'crew_melee_00': Upgrade(
-            'crew_melee_00',
-            "Punching Bag (Melee Damage)",
+        'ship_boost_00': (
+            'Propeller Booster',
+            'ship_booster',
+            'ability',
+            ),
+        'crew_melee_00': (
+            'Punching Bag (Melee Damage)',
             None,
             'main',
             ),
-        'crew_move_00': Upgrade(
-            'crew_move_00',
-            "Treadmill (Move Distance)",
+        'money_bonus_01': (
+            'Purifier Efficiency',
             None,
             'main',
             ),
-        'jobupgrade_tank_1': Upgrade(
-            'jobupgrade_tank_1',
-            "Trusty Sidearm+",
+        'jobupgrade_reaper_2': (
+            'Rage+',
             None,
             'guildhall',
             ),
-        'jobupgrade_tank_2': Upgrade(
-            'jobupgrade_tank_2',
-            "Payback+",
-            None,
-            'guildhall',
+        'celestial_gear_07': (
+            'Ruby Gear (XP Bonus)',
+            'keyitem_celestial_gear_07',
+            'ability',
             ),
-        'jobupgrade_tank_3': Upgrade(
-            'jobupgrade_tank_3',
-            "Hard Shell+",
-            None,
-            'guildhall',
+        'celestial_gear_04': (
+            'Sapphire Gear (Cogs)',
+            'keyitem_celestial_gear_04',
+            'ability',
             ),
-        'jobupgrade_boomer_1': Upgrade(
-            'jobupgrade_boomer_1',
-            "Hidden Explosives+",
+        'jobupgrade_flanker_2': (
+            'Sidestep+',
             None,
             'guildhall',
             ),
-        'jobupgrade_boomer_2': Upgrade(
-            'jobupgrade_boomer_2',
-            "Slot Machine+",
+        'jobupgrade_boomer_2': (
+            'Slot Machine+',
             None,
             'guildhall',
             ),
-        'jobupgrade_boomer_3': Upgrade(
-            'jobupgrade_boomer_3',
-            "Loose Cannon+",
+        'equip_slot_00': (
+            'Sub Equipment Slot',
             None,
-            'guildhall',
+            'main',
             ),
-        'jobupgrade_engineer_1': Upgrade(
-            'jobupgrade_engineer_1',
-            "Greased Up+",
+        'equip_slot_01': (
+            'Sub Equipment Slot',
             None,
-            'guildhall',
+            'main',
             ),
-        'jobupgrade_engineer_2': Upgrade(
-            'jobupgrade_engineer_2',
-            "Amped Up+",
+        'equip_slot_02': (
+            'Sub Equipment Slot',
             None,
-            'guildhall',
+            'main',
             ),
-        'jobupgrade_engineer_3': Upgrade(
-            'jobupgrade_engineer_3',
-            "Break+",
+        'equip_slot_03': (
+            'Sub Equipment Slot',
             None,
-            'guildhall',
+            'main',
             ),
-        'jobupgrade_sniper_1': Upgrade(
-            'jobupgrade_sniper_1',
-            "Power Shot+",
+        'equip_slot_04': (
+            'Sub Equipment Slot',
             None,
-            'guildhall',
+            'main',
             ),
-        'jobupgrade_sniper_2': Upgrade(
-            'jobupgrade_sniper_2',
-            "Focus+",
+        'equip_slot_05': (
+            'Sub Equipment Slot',
             None,
-            'guildhall',
+            'main',
             ),
-        'jobupgrade_sniper_3': Upgrade(
-            'jobupgrade_sniper_3',
-            "Hunter's Mark+",
+        'equip_00': (
+            'Sub Equipment Terminal',
             None,
-            'guildhall',
+            'main',
             ),
-        'jobupgrade_reaper_1': Upgrade(
-            'jobupgrade_reaper_1',
-            "Warcry+",
+        'crew_move_00': (
+            'Treadmill (Move Distance)',
             None,
-            'guildhall',
+            'main',
             ),
-        'jobupgrade_reaper_2': Upgrade(
-            'jobupgrade_reaper_2',
-            "Rage+",
+        'jobupgrade_tank_1': (
+            'Trusty Sidearm+',
             None,
             'guildhall',
             ),
-        'jobupgrade_reaper_3': Upgrade(
-            'jobupgrade_reaper_3',
-            "Harvest+",
+        'extra_utility_00': (
+            'Utility Belts',
             None,
-            'guildhall',
+            'main',
             ),
-        'jobupgrade_flanker_1': Upgrade(
-            'jobupgrade_flanker_1',
-            "Backbiter+",
+        'jobupgrade_reaper_1': (
+            'Warcry+',
             None,
             'guildhall',
             ),
-        'jobupgrade_flanker_2': Upgrade(
-            'jobupgrade_flanker_2',
-            "Sidestep+",
+        'money_bonus_00': (
+            'Water Purifier',
             None,
-            'guildhall',
+            'main',
             ),
-        'jobupgrade_flanker_3': Upgrade(
-            'jobupgrade_flanker_3',
+        'jobupgrade_flanker_3': (
             "Wheel 'n Deal+",
             None,
             'guildhall',
             ),
-        'celestial_gear_01': Upgrade(
-            'celestial_gear_01',
-            "Golden Gear (Health)",
-            'keyitem_celestial_gear_01',
-            'ability',
-            ),
-        'celestial_gear_02': Upgrade(
-            'celestial_gear_02',
-            "Amethyst Gear (Move Distance)",
-            'keyitem_celestial_gear_02',
-            'ability',
-            ),
-        'celestial_gear_03': Upgrade(
-            'celestial_gear_03',
-            "Emerald Gear (Aura, Melee Damage)",
-            'keyitem_celestial_gear_03',
-            'ability',
-            ),
-        'celestial_gear_04': Upgrade(
-            'celestial_gear_04',
-            "Sapphire Gear (Cogs)",
-            'keyitem_celestial_gear_04',
-            'ability',
-            ),
-        'celestial_gear_05': Upgrade(
-            'celestial_gear_05',
-            "Diamond Gear (Aim)",
-            'keyitem_celestial_gear_05',
-            'ability',
-            ),
-        'celestial_gear_06': Upgrade(
-            'celestial_gear_06',
-            "Citrine Gear (Damage)",
-            'keyitem_celestial_gear_06',
-            'ability',
-            ),
-        'celestial_gear_07': Upgrade(
-            'celestial_gear_07',
-            "Ruby Gear (XP Bonus)",
-            'keyitem_celestial_gear_07',
-            'ability',
-            ),
-        }
+        })
 
-KEY_ITEMS = {
-        'steel_plates_west_caribbea_c': KeyItem(
-            'steel_plates_west_caribbea_c',
-            "Pressure Tank",
+KEY_ITEMS = LazyMap(KeyItem, {
+        'steel_plates_west_caribbea_c': (
+            'Pressure Tank',
             ['dive_00'],
             ),
-        'ship_booster': KeyItem(
-            'ship_booster',
-            "Propeller Booster",
+        'ship_booster': (
+            'Propeller Booster',
             ['ship_boost_00'],
             ),
-        'keyitem_ship_shield': KeyItem(
-            'keyitem_ship_shield',
-            "Energy Shield",
+        'keyitem_ship_shield': (
+            'Energy Shield',
             ),
-        'atomic_engine': KeyItem(
-            'atomic_engine',
-            "Atomic Engine",
+        'atomic_engine': (
+            'Atomic Engine',
             ['dive_02', 'geiger_counter_01'],
             ),
-        'keyitem_ship_ram': KeyItem(
-            'keyitem_ship_ram',
-            "Ram",
+        'keyitem_ship_ram': (
+            'Ram',
             ),
-        'keyitem_glow_rod_01': KeyItem(
-            'keyitem_glow_rod_01',
-            "Glow Rod",
+        'keyitem_glow_rod_01': (
+            'Glow Rod',
             ),
-        'keyitem_glow_rod_02': KeyItem(
-            'keyitem_glow_rod_02',
-            "Glow Rod",
+        'keyitem_glow_rod_02': (
+            'Glow Rod',
             ),
-        'keyitem_glow_rod_03': KeyItem(
-            'keyitem_glow_rod_03',
-            "Glow Rod",
+        'keyitem_glow_rod_03': (
+            'Glow Rod',
             ),
-        'keyitem_glow_rod_04': KeyItem(
-            'keyitem_glow_rod_04',
-            "Glow Rod",
+        'keyitem_glow_rod_04': (
+            'Glow Rod',
             ),
-        'keyitem_glow_rod_05': KeyItem(
-            'keyitem_glow_rod_05',
-            "Glow Rod",
+        'keyitem_glow_rod_05': (
+            'Glow Rod',
             ),
-        'keyitem_glow_rod_06': KeyItem(
-            'keyitem_glow_rod_06',
-            "Glow Rod",
+        'keyitem_glow_rod_06': (
+            'Glow Rod',
             ),
-        'keyitem_krakenhorn': KeyItem(
-            'keyitem_krakenhorn',
-            "The Kraken Horn",
+        'keyitem_krakenhorn': (
+            'The Kraken Horn',
             ),
-        'keyitem_geiger_counter': KeyItem(
-            'keyitem_geiger_counter',
-            "Geiger Counter",
+        'keyitem_geiger_counter': (
+            'Geiger Counter',
             ['geiger_counter_00'],
             ),
-        'hub_c_heist_blueprints': KeyItem(
-            'hub_c_heist_blueprints',
-            "Navy Fort Blueprints",
+        'hub_c_heist_blueprints': (
+            'Navy Fort Blueprints',
             ),
-        'west_caribbea_mechanic_heist_key': KeyItem(
-            'west_caribbea_mechanic_heist_key',
-            "Stockades Key",
+        'west_caribbea_mechanic_heist_key': (
+            'Stockades Key',
             ),
-        'arctica_hub_d_heist_key': KeyItem(
-            'arctica_hub_d_heist_key',
-            "Research Facility Key",
+        'arctica_hub_d_heist_key': (
+            'Research Facility Key',
             ),
-        'east_caribbea_navy_boss_key': KeyItem(
-            'east_caribbea_navy_boss_key',
+        'east_caribbea_navy_boss_key': (
             "Piston's Palace Key",
             ),
-        'vec_tech_communicators': KeyItem(
-            'vec_tech_communicators',
-            "Vec-Tech Communicators",
+        'vec_tech_communicators': (
+            'Vec-Tech Communicators',
             ),
-        'hub_c_flagship_codes': KeyItem(
-            'hub_c_flagship_codes',
-            "Secret Navy Codes",
+        'hub_c_flagship_codes': (
+            'Secret Navy Codes',
             ),
-        'keyitem_parley_invitation': KeyItem(
-            'keyitem_parley_invitation',
-            "Parley Invitation",
+        'keyitem_parley_invitation': (
+            'Parley Invitation',
             ),
-        'keyitem_celestial_gear_01': KeyItem(
-            'keyitem_celestial_gear_01',
-            "Golden Gear",
+        'keyitem_celestial_gear_01': (
+            'Golden Gear',
             ['celestial_gear_01'],
             ),
-        'keyitem_celestial_gear_02': KeyItem(
-            'keyitem_celestial_gear_02',
-            "Amethyst Gear",
+        'keyitem_celestial_gear_02': (
+            'Amethyst Gear',
             ['celestial_gear_02'],
             ),
-        'keyitem_celestial_gear_03': KeyItem(
-            'keyitem_celestial_gear_03',
-            "Emerald Gear",
+        'keyitem_celestial_gear_03': (
+            'Emerald Gear',
             ['celestial_gear_03'],
             ),
-        'keyitem_celestial_gear_04': KeyItem(
-            'keyitem_celestial_gear_04',
-            "Sapphire Gear",
+        'keyitem_celestial_gear_04': (
+            'Sapphire Gear',
             ['celestial_gear_04'],
             ),
-        'keyitem_celestial_gear_05': KeyItem(
-            'keyitem_celestial_gear_05',
-            "Diamond Gear",
+        'keyitem_celestial_gear_05': (
+            'Diamond Gear',
             ['celestial_gear_05'],
             ),
-        'keyitem_celestial_gear_06': KeyItem(
-            'keyitem_celestial_gear_06',
-            "Citrine Gear",
+        'keyitem_celestial_gear_06': (
+            'Citrine Gear',
             ['celestial_gear_06'],
             ),
-        'keyitem_celestial_gear_07': KeyItem(
-            'keyitem_celestial_gear_07',
-            "Ruby Gear",
+        'keyitem_celestial_gear_07': (
+            'Ruby Gear',
             ['celestial_gear_07'],
             ),
-        }
+        })
 
-HATS = {
-        'hat_captain': Hat(
-            'hat_captain',
-            "Captain's Hat",
+# Sorted by label
+HATS = LazyMap(Hat, {
+        'hat_navy_commander_fancy03': (
+            '...Fancy Wig?',
             ),
-        'hat_daisy': Hat(
-            'hat_daisy',
-            "Flop Cap",
+        'hat_shop_fish': (
+            'A Fish',
             ),
-        'hat_wesley': Hat(
-            'hat_wesley',
-            "Pickelhaube",
+        'hat_cyclop': (
+            'A Simple Beanie',
             ),
-        'hat_cornelius': Hat(
-            'hat_cornelius',
-            "Fez",
+        'hat_diver': (
+            'A Simple Valve',
             ),
-        'hat_poe': Hat(
-            'hat_poe',
-            "Roguish Antenna",
+        'hat_navy_seabot_rare01': (
+            'Army Helmet',
             ),
-        'hat_judy': Hat(
-            'hat_judy',
-            "Leather Hat",
+        'hat_atomic_reviver': (
+            'Atomic Helm',
             ),
-        'hat_adventure_boy': Hat(
-            'hat_adventure_boy',
-            "Spiky Hair",
+        'hat_atomic_water_scientist': (
+            'Band of Icy Revenge',
             ),
-        'hat_diver': Hat(
-            'hat_diver',
-            "A Simple Valve",
+        'hat_navy_seabot_rare04': (
+            'Bearskin',
             ),
-        'hat_crow': Hat(
-            'hat_crow',
-            "Soft Cloth Hat",
+        'hat_navy_drone': (
+            'Blue Rotating Beacon',
             ),
-        'hat_cyclop': Hat(
-            'hat_cyclop',
-            "A Simple Beanie",
+        'hat_pirate_berserker': (
+            'Bull Horns',
             ),
-        'hat_chimney': Hat(
-            'hat_chimney',
-            "Sailor's Cap",
+        'hat_piper': (
+            "Captain Faraday's Hat",
             ),
-        'hat_mother': Hat(
-            'hat_mother',
-            "Krakenbane's Hat",
+        'hat_captain': (
+            "Captain's Hat",
             ),
-        'hat_piper': Hat(
-            'hat_piper',
-            "Captain Faraday's Hat",
+        'hat_pirate_berserker_rare01': (
+            'Cardboard Box',
             ),
-        'hat_revolution_beret': Hat(
-            'hat_revolution_beret',
-            "Rebellious Beret",
+        'hat_navy_commander': (
+            'Commander Hat',
             ),
-        'hat_navy_seabot': Hat(
-            'hat_navy_seabot',
-            "Navy Soldier Cap",
+        'hat_navy_mech_operator': (
+            'Complex Navy Hat',
             ),
-        'hat_navy_seabot_elite': Hat(
-            'hat_navy_seabot_elite',
-            "Elite Soldier Cap",
+        'hat_pirate_skelebot_ice': (
+            'Cool Cube',
             ),
-        'hat_navy_seabot_machinegunner': Hat(
-            'hat_navy_seabot_machinegunner',
-            "Machinegunner Hat",
+        'hat_navy_seabot_rare03': (
+            'Cowboy Hat',
             ),
-        'hat_navy_seabot_machinegunner_elite': Hat(
-            'hat_navy_seabot_machinegunner_elite',
-            "Elite Machinegunner Hat",
+        'hat_atomic_mech_operator': (
+            'Crown of Reckoning',
             ),
-        'hat_navy_seabot_shotgunner': Hat(
-            'hat_navy_seabot_shotgunner',
-            "Shotgunner Hat",
+        'hat_pirate_totem_bearer_rare01': (
+            'Crown of Thorns',
             ),
-        'hat_navy_seabot_shotgunner_elite': Hat(
-            'hat_navy_seabot_shotgunner_elite',
-            "Elite Shotgunner Hat",
+        'hat_atomic_flying_reviver': (
+            'Crystal Crown',
             ),
-        'hat_navy_seabot_sniper': Hat(
-            'hat_navy_seabot_sniper',
-            "Sniper Goggle",
+        'hat_atomic_walking_bomb': (
+            'Delectable Cone',
             ),
-        'hat_navy_seabot_sniper_elite': Hat(
-            'hat_navy_seabot_sniper_elite',
-            "Elite Sniper Goggle",
+        'hat_navy_commander_elite': (
+            'Elite Commander Hat',
             ),
-        'hat_navy_seabot_swordsman': Hat(
-            'hat_navy_seabot_swordsman',
-            "Swordsman's Hat",
+        'hat_navy_guard_elite': (
+            'Elite Guard Hat',
             ),
-        'hat_navy_seabot_swordsman_elite': Hat(
-            'hat_navy_seabot_swordsman_elite',
-            "Elite Swordsman's Hat",
+        'hat_navy_seabot_machinegunner_elite': (
+            'Elite Machinegunner Hat',
             ),
-        'hat_navy_seabot_rare01': Hat(
-            'hat_navy_seabot_rare01',
-            "Army Helmet",
+        'hat_navy_seabot_shotgunner_elite': (
+            'Elite Shotgunner Hat',
             ),
-        'hat_navy_seabot_rare02': Hat(
-            'hat_navy_seabot_rare02',
-            "Safari Hat",
+        'hat_navy_seabot_sniper_elite': (
+            'Elite Sniper Goggle',
             ),
-        'hat_navy_seabot_rare03': Hat(
-            'hat_navy_seabot_rare03',
-            "Cowboy Hat",
+        'hat_navy_seabot_elite': (
+            'Elite Soldier Cap',
             ),
-        'hat_navy_seabot_rare04': Hat(
-            'hat_navy_seabot_rare04',
-            "Bearskin",
+        'hat_navy_seabot_swordsman_elite': (
+            "Elite Swordsman's Hat",
             ),
-        'hat_navy_seabot_fire': Hat(
-            'hat_navy_seabot_fire',
-            "Fire helmet",
+        'hat_navy_commander_fancy01': (
+            'Fancier Wig',
             ),
-        'hat_navy_seabot_bigsteve': Hat(
-            'hat_navy_seabot_bigsteve',
-            "Floppy Hat",
+        'hat_navy_commander_fancy02': (
+            'Fancy Wig',
             ),
-        'hat_navy_seabot_tough': Hat(
-            'hat_navy_seabot_tough',
-            "Iron Mask",
+        'hat_cornelius': (
+            'Fez',
             ),
-        'hat_navy_seabot_roaster': Hat(
-            'hat_navy_seabot_roaster',
-            "Savory Bucket",
+        'hat_navy_seabot_fire': (
+            'Fire helmet',
             ),
-        'hat_navy_guard': Hat(
-            'hat_navy_guard',
-            "Navy Guard Hat",
+        'hat_daisy': (
+            'Flop Cap',
             ),
-        'hat_navy_guard_elite': Hat(
-            'hat_navy_guard_elite',
-            "Elite Guard Hat",
+        'hat_navy_seabot_bigsteve': (
+            'Floppy Hat',
             ),
-        'hat_navy_guard_roaster': Hat(
-            'hat_navy_guard_roaster',
-            "Lit Candle",
+        'hat_pirate_bomb': (
+            'Frosty Propeller',
             ),
-        'hat_navy_commander': Hat(
-            'hat_navy_commander',
-            "Commander Hat",
+        'hat_shop_fruit': (
+            'Fruity Hat',
             ),
-        'hat_navy_commander_elite': Hat(
-            'hat_navy_commander_elite',
-            "Elite Commander Hat",
+        'hat_shop_fur': (
+            'Fur Hat',
             ),
-        'hat_navy_commander_rare01': Hat(
-            'hat_navy_commander_rare01',
-            "Pilot Hat",
+        'hat_pirate_swab_ice': (
+            'Fur-Lined Seashell Hat',
             ),
-        'hat_navy_commander_rare02': Hat(
-            'hat_navy_commander_rare02',
-            "The Bonaparte",
+        'hat_navy_fabio': (
+            'Glorious Pompadour',
             ),
-        'hat_navy_commander_dean': Hat(
-            'hat_navy_commander_dean',
-            "Rugged Veteran's Hat",
+        'hat_atomic_reviver_rare01': (
+            'Graduate Hat',
             ),
-        'hat_navy_commander_warden': Hat(
-            'hat_navy_commander_warden',
-            "Prison Warden Hat",
+        'hat_shop_screen': (
+            'Green Screen',
             ),
-        'hat_navy_commander_fancy01': Hat(
-            'hat_navy_commander_fancy01',
-            "Fancier Wig",
+        'hat_navy_bomb': (
+            'Heated Propeller',
             ),
-        'hat_navy_commander_fancy02': Hat(
-            'hat_navy_commander_fancy02',
-            "Fancy Wig",
+        'hat_pirate_swab_elite': (
+            'Horned Seashell',
             ),
-        'hat_navy_commander_fancy03': Hat(
-            'hat_navy_commander_fancy03',
-            "...Fancy Wig?",
+        'hat_pirate_berserker_ice': (
+            'Icy Horns',
             ),
-        'hat_navy_commander_roaster': Hat(
-            'hat_navy_commander_roaster',
-            "Very Cool Cap",
+        'hat_atomic_reviver_king': (
+            'Infinity Crown',
             ),
-        'hat_navy_recruit': Hat(
-            'hat_navy_recruit',
-            "Recruit Hat",
+        'hat_navy_seabot_tough': (
+            'Iron Mask',
             ),
-        'hat_navy_recruit_rare01': Hat(
-            'hat_navy_recruit_rare01',
-            "Paper Boat",
+        'hat_atomic_walking_bomb_rare01': (
+            'Jellyfish',
             ),
-        'hat_navy_fabio': Hat(
-            'hat_navy_fabio',
-            "Glorious Pompadour",
+        'hat_shop_santa': (
+            'Jolly Hat',
             ),
-        'hat_navy_mech_operator': Hat(
-            'hat_navy_mech_operator',
-            "Complex Navy Hat",
+        'hat_pirate_totem_bearer_pain': (
+            'Knife in the Head',
             ),
-        'hat_navy_drone': Hat(
-            'hat_navy_drone',
-            "Blue Rotating Beacon",
+        'hat_mother': (
+            "Krakenbane's Hat",
             ),
-        'hat_navy_drone_rare01': Hat(
-            'hat_navy_drone_rare01',
-            "Party Light",
+        'hat_judy': (
+            'Leather Hat',
             ),
-        'hat_navy_bomb': Hat(
-            'hat_navy_bomb',
-            "Heated Propeller",
+        'hat_navy_guard_roaster': (
+            'Lit Candle',
             ),
-        'hat_pirate_totem_bearer': Hat(
-            'hat_pirate_totem_bearer',
-            "Occult Cone",
+        'hat_navy_seabot_machinegunner': (
+            'Machinegunner Hat',
             ),
-        'hat_pirate_totem_bearer_bone': Hat(
-            'hat_pirate_totem_bearer_bone',
-            "Occult Bone Cone",
+        'hat_shop_icecream': (
+            'Magical Horn',
             ),
-        'hat_pirate_totem_bearer_ice': Hat(
-            'hat_pirate_totem_bearer_ice',
-            "Occult Ice Cone",
+        'hat_atomic_flying_reviver_rare01': (
+            "Marvin's Helmet",
             ),
-        'hat_pirate_totem_bearer_retribution': Hat(
-            'hat_pirate_totem_bearer_retribution',
-            "Occult Retribution Cone",
+        'hat_atomic_mimic': (
+            'Mimic Mask',
             ),
-        'hat_pirate_totem_bearer_lightning': Hat(
-            'hat_pirate_totem_bearer_lightning',
-            "Occult Conductor Cone",
+        'hat_pirate_morgan': (
+            "Morgan's Spire",
             ),
-        'hat_pirate_totem_bearer_rare01': Hat(
-            'hat_pirate_totem_bearer_rare01',
-            "Crown of Thorns",
+        'hat_navy_guard': (
+            'Navy Guard Hat',
             ),
-        'hat_pirate_totem_bearer_pain': Hat(
-            'hat_pirate_totem_bearer_pain',
-            "Knife in the Head",
+        'hat_navy_seabot': (
+            'Navy Soldier Cap',
             ),
-        'hat_pirate_skelebot': Hat(
-            'hat_pirate_skelebot',
-            "Small Spiky Helmet",
+        'hat_pirate_totem_bearer_bone': (
+            'Occult Bone Cone',
             ),
-        'hat_pirate_skelebot_ice': Hat(
-            'hat_pirate_skelebot_ice',
-            "Cool Cube",
+        'hat_pirate_totem_bearer_lightning': (
+            'Occult Conductor Cone',
             ),
-        'hat_pirate_swab': Hat(
-            'hat_pirate_swab',
-            "Seashellmet",
+        'hat_pirate_totem_bearer': (
+            'Occult Cone',
             ),
-        'hat_pirate_swab_elite': Hat(
-            'hat_pirate_swab_elite',
-            "Horned Seashell",
+        'hat_pirate_totem_bearer_ice': (
+            'Occult Ice Cone',
             ),
-        'hat_pirate_swab_ice': Hat(
-            'hat_pirate_swab_ice',
-            "Fur-Lined Seashell Hat",
+        'hat_pirate_totem_bearer_retribution': (
+            'Occult Retribution Cone',
             ),
-        'hat_pirate_swab_tough': Hat(
-            'hat_pirate_swab_tough',
-            "Uni-horn",
+        'hat_atomic_reviver_rare02': (
+            'Octopus',
             ),
-        'hat_pirate_swab_rare01': Hat(
-            'hat_pirate_swab_rare01',
-            "Tinfoil Hat",
+        'hat_navy_recruit_rare01': (
+            'Paper Boat',
             ),
-        'hat_pirate_swab_rare02': Hat(
-            'hat_pirate_swab_rare02',
-            "Seagull Nest",
+        'hat_navy_drone_rare01': (
+            'Party Light',
             ),
-        'hat_pirate_swab_rare03': Hat(
-            'hat_pirate_swab_rare03',
-            "Viking Helmet",
+        'hat_wesley': (
+            'Pickelhaube',
             ),
-        'hat_pirate_berserker': Hat(
-            'hat_pirate_berserker',
-            "Bull Horns",
+        'hat_navy_commander_rare01': (
+            'Pilot Hat',
             ),
-        'hat_pirate_berserker_ice': Hat(
-            'hat_pirate_berserker_ice',
-            "Icy Horns",
+        'hat_pirate_berserker_rare02': (
+            'Pretty Bow',
             ),
-        'hat_pirate_berserker_rare01': Hat(
-            'hat_pirate_berserker_rare01',
-            "Cardboard Box",
+        'hat_navy_commander_warden': (
+            'Prison Warden Hat',
             ),
-        'hat_pirate_berserker_rare02': Hat(
-            'hat_pirate_berserker_rare02',
-            "Pretty Bow",
+        'hat_pirate_berserker_parley': (
+            'Propeller Cap',
             ),
-        'hat_pirate_berserker_parley': Hat(
-            'hat_pirate_berserker_parley',
-            "Propeller Cap",
+        'hat_shop_bandana': (
+            'Purple bandana',
             ),
-        'hat_pirate_morgan': Hat(
-            'hat_pirate_morgan',
-            "Morgan's Spire",
+        'hat_revolution_beret': (
+            'Rebellious Beret',
             ),
-        'hat_pirate_bomb': Hat(
-            'hat_pirate_bomb',
-            "Frosty Propeller",
+        'hat_navy_recruit': (
+            'Recruit Hat',
             ),
-        'hat_atomic_reviver': Hat(
-            'hat_atomic_reviver',
-            "Atomic Helm",
+        'hat_poe': (
+            'Roguish Antenna',
             ),
-        'hat_atomic_reviver_king': Hat(
-            'hat_atomic_reviver_king',
-            "Infinity Crown",
+        'hat_navy_commander_dean': (
+            "Rugged Veteran's Hat",
             ),
-        'hat_atomic_reviver_rare01': Hat(
-            'hat_atomic_reviver_rare01',
-            "Graduate Hat",
+        'hat_navy_seabot_rare02': (
+            'Safari Hat',
             ),
-        'hat_atomic_reviver_rare02': Hat(
-            'hat_atomic_reviver_rare02',
-            "Octopus",
+        'hat_chimney': (
+            "Sailor's Cap",
             ),
-        'hat_atomic_flying_reviver': Hat(
-            'hat_atomic_flying_reviver',
-            "Crystal Crown",
+        'hat_navy_seabot_roaster': (
+            'Savory Bucket',
             ),
-        'hat_atomic_flying_reviver_rare01': Hat(
-            'hat_atomic_flying_reviver_rare01',
-            "Marvin's Helmet",
+        'hat_pirate_swab_rare02': (
+            'Seagull Nest',
             ),
-        'hat_atomic_walking_bomb': Hat(
-            'hat_atomic_walking_bomb',
-            "Delectable Cone",
+        'hat_pirate_swab': (
+            'Seashellmet',
             ),
-        'hat_atomic_walking_bomb_rare01': Hat(
-            'hat_atomic_walking_bomb_rare01',
-            "Jellyfish",
+        'hat_navy_seabot_shotgunner': (
+            'Shotgunner Hat',
             ),
-        'hat_atomic_mimic': Hat(
-            'hat_atomic_mimic',
-            "Mimic Mask",
+        'hat_pirate_skelebot': (
+            'Small Spiky Helmet',
             ),
-        'hat_atomic_mech_operator': Hat(
-            'hat_atomic_mech_operator',
-            "Crown of Reckoning",
+        'hat_navy_seabot_sniper': (
+            'Sniper Goggle',
             ),
-        'hat_atomic_water_scientist': Hat(
-            'hat_atomic_water_scientist',
-            "Band of Icy Revenge",
+        'hat_shop_snorkel': (
+            'Snorkling Gear',
             ),
-        'hat_shop_fish': Hat(
-            'hat_shop_fish',
-            "A Fish",
+        'hat_crow': (
+            'Soft Cloth Hat',
             ),
-        'hat_shop_fur': Hat(
-            'hat_shop_fur',
-            "Fur Hat",
+        'hat_adventure_boy': (
+            'Spiky Hair',
             ),
-        'hat_shop_ushanka': Hat(
-            'hat_shop_ushanka',
-            "Ushanka",
+        'hat_shop_straw': (
+            'Straw Hat',
             ),
-        'hat_shop_rain': Hat(
-            'hat_shop_rain',
-            "Sylvester",
+        'hat_shop_kanga': (
+            'Stylish Hat',
             ),
-        'hat_shop_kanga': Hat(
-            'hat_shop_kanga',
-            "Stylish Hat",
+        'hat_navy_seabot_swordsman': (
+            "Swordsman's Hat",
             ),
-        'hat_shop_valkyrie': Hat(
-            'hat_shop_valkyrie',
-            "Valkyrie Helmet",
+        'hat_shop_rain': (
+            'Sylvester',
             ),
-        'hat_shop_santa': Hat(
-            'hat_shop_santa',
-            "Jolly Hat",
+        'hat_navy_commander_rare02': (
+            'The Bonaparte',
             ),
-        'hat_shop_fruit': Hat(
-            'hat_shop_fruit',
-            "Fruity Hat",
+        'hat_pirate_swab_rare01': (
+            'Tinfoil Hat',
             ),
-        'hat_shop_snorkel': Hat(
-            'hat_shop_snorkel',
-            "Snorkling Gear",
+        'hat_shop_top': (
+            'Top Hat',
             ),
-        'hat_shop_screen': Hat(
-            'hat_shop_screen',
-            "Green Screen",
+        'hat_pirate_swab_tough': (
+            'Uni-horn',
             ),
-        'hat_shop_straw': Hat(
-            'hat_shop_straw',
-            "Straw Hat",
+        'hat_shop_ushanka': (
+            'Ushanka',
             ),
-        'hat_shop_wickedshades': Hat(
-            'hat_shop_wickedshades',
-            "Wicked Shades",
+        'hat_shop_valkyrie': (
+            'Valkyrie Helmet',
             ),
-        'hat_shop_top': Hat(
-            'hat_shop_top',
-            "Top Hat",
+        'hat_navy_commander_roaster': (
+            'Very Cool Cap',
             ),
-        'hat_shop_icecream': Hat(
-            'hat_shop_icecream',
-            "Magical Horn",
+        'hat_pirate_swab_rare03': (
+            'Viking Helmet',
             ),
-        'hat_shop_bandana': Hat(
-            'hat_shop_bandana',
-            "Purple bandana",
+        'hat_shop_wickedshades': (
+            'Wicked Shades',
             ),
-        }
+        })
 
-SHIP_EQUIPMENT = {
-        'ship_equipment_torpedo_01': ShipEquipment(
-            'ship_equipment_torpedo_01',
-            "Torpedo I",
+# Sorted by label
+SHIP_EQUIPMENT = LazyMap(ShipEquipment, {
+        'ship_equipment_module_health_01': (
+            'Armored Plating I',
             ),
-        'ship_equipment_torpedo_02': ShipEquipment(
-            'ship_equipment_torpedo_02',
-            "Torpedo II",
+        'ship_equipment_module_health_02': (
+            'Armored Plating II',
             ),
-        'ship_equipment_torpedo_02_rare': ShipEquipment(
-            'ship_equipment_torpedo_02_rare',
-            "Rapid Torpedo",
+        'ship_equipment_module_health_03': (
+            'Armored Plating III',
             ),
-        'ship_equipment_torpedo_03': ShipEquipment(
-            'ship_equipment_torpedo_03',
-            "Torpedo III",
+        'ship_equipment_module_air_01': (
+            'Auxiliary Air Tank',
             ),
-        'ship_equipment_machinegun_01': ShipEquipment(
-            'ship_equipment_machinegun_01',
-            "Machine Guns I",
+        'ship_equipment_charge_laser_01': (
+            'Charge Laser I',
             ),
-        'ship_equipment_machinegun_02': ShipEquipment(
-            'ship_equipment_machinegun_02',
-            "Machine Guns II",
+        'ship_equipment_charge_laser_02': (
+            'Charge Laser II',
             ),
-        'ship_equipment_machinegun_03': ShipEquipment(
-            'ship_equipment_machinegun_03',
-            "Machine Guns III",
+        'ship_equipment_module_speed_02_rare': (
+            'Elite Engine Booster',
             ),
-        'ship_equipment_micro_torpedo_01': ShipEquipment(
-            'ship_equipment_micro_torpedo_01',
-            "Micro Torpedo I",
+        'ship_equipment_module_speed_01': (
+            'Engine Booster I',
             ),
-        'ship_equipment_micro_torpedo_02': ShipEquipment(
-            'ship_equipment_micro_torpedo_02',
-            "Micro Torpedo II",
+        'ship_equipment_module_speed_02': (
+            'Engine Booster II',
             ),
-        'ship_equipment_laser_01_rare': ShipEquipment(
-            'ship_equipment_laser_01_rare',
-            "Experimental Side Lasers",
+        'ship_equipment_module_speed_03': (
+            'Engine Booster III',
             ),
-        'ship_equipment_laser_02': ShipEquipment(
-            'ship_equipment_laser_02',
-            "Side Lasers",
+        'ship_equipment_laser_01_rare': (
+            'Experimental Side Lasers',
             ),
-        'ship_equipment_charge_laser_01': ShipEquipment(
-            'ship_equipment_charge_laser_01',
-            "Charge Laser I",
+        'ship_equipment_machinegun_heavy_01': (
+            'Heavy Machine Guns I',
             ),
-        'ship_equipment_charge_laser_02': ShipEquipment(
-            'ship_equipment_charge_laser_02',
-            "Charge Laser II",
+        'ship_equipment_machinegun_heavy_02': (
+            'Heavy Machine Guns II',
             ),
-        'ship_equipment_machinegun_heavy_01': ShipEquipment(
-            'ship_equipment_machinegun_heavy_01',
-            "Heavy Machine Guns I",
+        'ship_equipment_machinegun_heavy_03': (
+            'Heavy Machine Guns III',
             ),
-        'ship_equipment_machinegun_heavy_02': ShipEquipment(
-            'ship_equipment_machinegun_heavy_02',
-            "Heavy Machine Guns II",
+        'ship_equipment_module_laser_cooldown_rare_01': (
+            'Laser Cooling Unit I',
             ),
-        'ship_equipment_machinegun_heavy_03': ShipEquipment(
-            'ship_equipment_machinegun_heavy_03',
-            "Heavy Machine Guns III",
+        'ship_equipment_module_laser_cooldown_rare_02': (
+            'Laser Cooling Unit II',
             ),
-        'ship_equipment_cannon_01': ShipEquipment(
-            'ship_equipment_cannon_01',
-            "Top Cannon I",
+        'ship_equipment_module_machinegun_reload_01': (
+            'Machine Gun Auto-loader I',
             ),
-        'ship_equipment_cannon_02': ShipEquipment(
-            'ship_equipment_cannon_02',
-            "Top Cannon II",
+        'ship_equipment_module_machinegun_reload_02': (
+            'Machine Gun Auto-loader II',
             ),
-        'ship_equipment_machinegun_top_01': ShipEquipment(
-            'ship_equipment_machinegun_top_01',
-            "Top Machinegun",
+        'ship_equipment_machinegun_01': (
+            'Machine Guns I',
             ),
-        'ship_equipment_laser_top_01': ShipEquipment(
-            'ship_equipment_laser_top_01',
-            "Top Laser",
+        'ship_equipment_machinegun_02': (
+            'Machine Guns II',
             ),
-        'ship_equipment_torpedo_top_01': ShipEquipment(
-            'ship_equipment_torpedo_top_01',
-            "Top Torpedo",
+        'ship_equipment_machinegun_03': (
+            'Machine Guns III',
             ),
-        'ship_equipment_module_machinegun_reload_01': ShipEquipment(
-            'ship_equipment_module_machinegun_reload_01',
-            "Machine Gun Auto-loader I",
+        'ship_equipment_micro_torpedo_01': (
+            'Micro Torpedo I',
             ),
-        'ship_equipment_module_machinegun_reload_02': ShipEquipment(
-            'ship_equipment_module_machinegun_reload_02',
-            "Machine Gun Auto-loader II",
+        'ship_equipment_micro_torpedo_02': (
+            'Micro Torpedo II',
             ),
-        'ship_equipment_module_torpedo_damage_01': ShipEquipment(
-            'ship_equipment_module_torpedo_damage_01',
-            "Torpedo Damage I",
+        'ship_equipment_torpedo_02_rare': (
+            'Rapid Torpedo',
             ),
-        'ship_equipment_module_torpedo_damage_02': ShipEquipment(
-            'ship_equipment_module_torpedo_damage_02',
-            "Torpedo Damage II",
+        'ship_equipment_laser_02': (
+            'Side Lasers',
             ),
-        'ship_equipment_module_laser_cooldown_rare_01': ShipEquipment(
-            'ship_equipment_module_laser_cooldown_rare_01',
-            "Laser Cooling Unit I",
+        'ship_equipment_cannon_01': (
+            'Top Cannon I',
             ),
-        'ship_equipment_module_laser_cooldown_rare_02': ShipEquipment(
-            'ship_equipment_module_laser_cooldown_rare_02',
-            "Laser Cooling Unit II",
+        'ship_equipment_cannon_02': (
+            'Top Cannon II',
             ),
-        'ship_equipment_module_health_01': ShipEquipment(
-            'ship_equipment_module_health_01',
-            "Armored Plating I",
+        'ship_equipment_laser_top_01': (
+            'Top Laser',
             ),
-        'ship_equipment_module_health_02': ShipEquipment(
-            'ship_equipment_module_health_02',
-            "Armored Plating II",
+        'ship_equipment_machinegun_top_01': (
+            'Top Machinegun',
             ),
-        'ship_equipment_module_health_03': ShipEquipment(
-            'ship_equipment_module_health_03',
-            "Armored Plating III",
+        'ship_equipment_torpedo_top_01': (
+            'Top Torpedo',
             ),
-        'ship_equipment_module_speed_01': ShipEquipment(
-            'ship_equipment_module_speed_01',
-            "Engine Booster I",
+        'ship_equipment_module_torpedo_damage_01': (
+            'Torpedo Damage I',
             ),
-        'ship_equipment_module_speed_02': ShipEquipment(
-            'ship_equipment_module_speed_02',
-            "Engine Booster II",
+        'ship_equipment_module_torpedo_damage_02': (
+            'Torpedo Damage II',
             ),
-        'ship_equipment_module_speed_02_rare': ShipEquipment(
-            'ship_equipment_module_speed_02_rare',
-            "Elite Engine Booster",
+        'ship_equipment_torpedo_01': (
+            'Torpedo I',
             ),
-        'ship_equipment_module_speed_03': ShipEquipment(
-            'ship_equipment_module_speed_03',
-            "Engine Booster III",
+        'ship_equipment_torpedo_02': (
+            'Torpedo II',
             ),
-        'ship_equipment_module_air_01': ShipEquipment(
-            'ship_equipment_module_air_01',
-            "Auxiliary Air Tank",
+        'ship_equipment_torpedo_03': (
+            'Torpedo III',
             ),
-        }
+        })
 
-UTILITIES = {
-        'utility_repair_01': Utility(
-            'utility_repair_01',
-            "Repair Kit I",
+# Sorted by label
+UTILITIES = LazyMap(Utility, {
+        'utility_stimpack_rare': (
+            'Air Stim',
             ),
-        'utility_repair_01_rare': Utility(
-            'utility_repair_01_rare',
-            "Big Repair Pack",
+        'utility_aura_plus': (
+            'Aura Booster',
             ),
-        'utility_repair_02': Utility(
-            'utility_repair_02',
-            "Repair Kit II",
+        'utility_boots_02': (
+            'Better Boots',
             ),
-        'utility_repair_02_rare': Utility(
-            'utility_repair_02_rare',
-            "Jazzy Repair Record",
+        'utility_repair_01_rare': (
+            'Big Repair Pack',
             ),
-        'utility_repair_03': Utility(
-            'utility_repair_03',
-            "Repair Kit III",
+        'utility_boots_01': (
+            'Boots',
             ),
-        'utility_repair_03_rare': Utility(
-            'utility_repair_03_rare',
-            "Regeneration Field",
+        'utility_grenade_04_rare': (
+            'Box of Grenades',
             ),
-        'utility_stimpack_rare': Utility(
-            'utility_stimpack_rare',
-            "Air Stim",
+        'utility_sidearm_05_rare': (
+            'Box of Sidearms',
             ),
-        'utility_armor_01': Utility(
-            'utility_armor_01',
-            "Reinforced Plating I",
+        'utility_cogs_01': (
+            'Cog Chain I',
             ),
-        'utility_armor_01_rare': Utility(
-            'utility_armor_01_rare',
-            "Heavy Reinforced Plating",
+        'utility_cogs_02': (
+            'Cog Chain II',
             ),
-        'utility_armor_01_warm': Utility(
-            'utility_armor_01_warm',
-            "Heated Plating",
+        'utility_cogs_03': (
+            'Cog Chain III',
             ),
-        'utility_armor_02': Utility(
-            'utility_armor_02',
-            "Reinforced Plating II",
+        'utility_cool_rare': (
+            'Cooler Unit',
             ),
-        'utility_armor_03': Utility(
-            'utility_armor_03',
-            "Reinforced Plating III",
+        'utility_goggles_rare': (
+            'Critical Goggles',
             ),
-        'utility_grenade_00': Utility(
-            'utility_grenade_00',
-            "Homemade Grenade",
+        'utility_crit_plus_1': (
+            'Critical Rounds',
             ),
-        'utility_grenade_01': Utility(
-            'utility_grenade_01',
-            "Grenade I",
+        'utility_experience_badge_01_rare': (
+            'Experience Badge',
             ),
-        'utility_grenade_01_rare': Utility(
-            'utility_grenade_01_rare',
-            "Quick Grenade",
+        'utility_boots_fireproof': (
+            'Fireproof Boots',
             ),
-        'utility_grenade_02': Utility(
-            'utility_grenade_02',
-            "Grenade II",
+        'utility_grenade_01': (
+            'Grenade I',
             ),
-        'utility_grenade_02_rare': Utility(
-            'utility_grenade_02_rare',
-            "Mutually Assured Destruction",
+        'utility_grenade_02': (
+            'Grenade II',
             ),
-        'utility_grenade_03_ice': Utility(
-            'utility_grenade_03_ice',
-            "Grenade III",
+        'utility_grenade_03_ice': (
+            'Grenade III',
             ),
-        'utility_grenade_03_rare': Utility(
-            'utility_grenade_03_rare',
-            "Stun Grenade",
+        'utility_grenade_04': (
+            'Grenade IV',
             ),
-        'utility_grenade_04': Utility(
-            'utility_grenade_04',
-            "Grenade IV",
+        'utility_grenade_05': (
+            'Grenade V',
             ),
-        'utility_grenade_04_rare': Utility(
-            'utility_grenade_04_rare',
-            "Box of Grenades",
+        'utility_armor_01_warm': (
+            'Heated Plating',
             ),
-        'utility_grenade_05': Utility(
-            'utility_grenade_05',
-            "Grenade V",
+        'utility_armor_01_rare': (
+            'Heavy Reinforced Plating',
             ),
-        'utility_grenade_06_rare': Utility(
-            'utility_grenade_06_rare',
-            "InstaBlast Grenade",
+        'utility_scope_03': (
+            'High-powered Scope',
             ),
-        'utility_rocket_01_rare': Utility(
-            'utility_rocket_01_rare',
-            "Portable Rocket",
+        'utility_grenade_00': (
+            'Homemade Grenade',
             ),
-        'utility_rocket_02_rare': Utility(
-            'utility_rocket_02_rare',
-            "Portable Nuke",
+        'utility_grenade_06_rare': (
+            'InstaBlast Grenade',
             ),
-        'utility_sidearm_01': Utility(
-            'utility_sidearm_01',
-            "Sidearm I",
+        'utility_repair_02_rare': (
+            'Jazzy Repair Record',
             ),
-        'utility_sidearm_01_rare': Utility(
-            'utility_sidearm_01_rare',
-            "Sniper Sidearm",
+        'utility_jetpack': (
+            'Jetpack',
             ),
-        'utility_sidearm_02': Utility(
-            'utility_sidearm_02',
-            "Sidearm II",
+        'utility_knuckle_01': (
+            'Knuckles I',
             ),
-        'utility_sidearm_03': Utility(
-            'utility_sidearm_03',
-            "Sidearm III",
+        'utility_knuckle_02': (
+            'Knuckles II',
             ),
-        'utility_sidearm_03_rare': Utility(
-            'utility_sidearm_03_rare',
-            "Quick Sidearm",
+        'utility_boots_crippleproof': (
+            'Military Boots',
             ),
-        'utility_sidearm_04': Utility(
-            'utility_sidearm_04',
-            "Sidearm IV",
+        'utility_grenade_02_rare': (
+            'Mutually Assured Destruction',
             ),
-        'utility_sidearm_05': Utility(
-            'utility_sidearm_05',
-            "Sidearm V",
+        'utility_pain_rare': (
+            'Pain Amulet',
             ),
-        'utility_sidearm_05_rare': Utility(
-            'utility_sidearm_05_rare',
-            "Box of Sidearms",
+        'utility_rocket_02_rare': (
+            'Portable Nuke',
             ),
-        'utility_sidearm_06_rare': Utility(
-            'utility_sidearm_06_rare',
-            "Sushi Sidearm",
+        'utility_rocket_01_rare': (
+            'Portable Rocket',
             ),
-        'utility_weapon_charger': Utility(
-            'utility_weapon_charger',
-            "Weapon Charger",
+        'utility_goggles_02_rare': (
+            'Precision Goggles',
             ),
-        'utility_knuckle_01': Utility(
-            'utility_knuckle_01',
-            "Knuckles I",
+        'utility_scope_02_rare': (
+            'Precision Scope',
             ),
-        'utility_knuckle_01_rare': Utility(
-            'utility_knuckle_01_rare',
-            "Warm Gloves",
+        'utility_grenade_01_rare': (
+            'Quick Grenade',
             ),
-        'utility_knuckle_02': Utility(
-            'utility_knuckle_02',
-            "Knuckles II",
+        'utility_sidearm_03_rare': (
+            'Quick Sidearm',
             ),
-        'utility_warm': Utility(
-            'utility_warm',
-            "Warm Scarf",
+        'utility_radiance_rare': (
+            'Radiance',
             ),
-        'utility_boots_01': Utility(
-            'utility_boots_01',
-            "Boots",
+        'utility_repair_03_rare': (
+            'Regeneration Field',
             ),
-        'utility_boots_01_rare': Utility(
-            'utility_boots_01_rare',
-            "Speed Boots",
+        'utility_armor_01': (
+            'Reinforced Plating I',
             ),
-        'utility_boots_crippleproof': Utility(
-            'utility_boots_crippleproof',
-            "Military Boots",
+        'utility_armor_02': (
+            'Reinforced Plating II',
             ),
-        'utility_boots_warm': Utility(
-            'utility_boots_warm',
-            "Warm Boots",
+        'utility_armor_03': (
+            'Reinforced Plating III',
             ),
-        'utility_boots_fireproof': Utility(
-            'utility_boots_fireproof',
-            "Fireproof Boots",
+        'utility_taser_rare': (
+            'Remote Taser',
             ),
-        'utility_boots_02': Utility(
-            'utility_boots_02',
-            "Better Boots",
+        'utility_repair_01': (
+            'Repair Kit I',
             ),
-        'utility_boots_03_rare': Utility(
-            'utility_boots_03_rare',
-            "Sonic Boots",
+        'utility_repair_02': (
+            'Repair Kit II',
             ),
-        'utility_crit_plus_1': Utility(
-            'utility_crit_plus_1',
-            "Critical Rounds",
+        'utility_repair_03': (
+            'Repair Kit III',
             ),
-        'utility_scope_01': Utility(
-            'utility_scope_01',
-            "Scope",
+        'utility_scope_01': (
+            'Scope',
             ),
-        'utility_scope_02_rare': Utility(
-            'utility_scope_02_rare',
-            "Precision Scope",
+        'utility_armor_boost_01_rare': (
+            'Sentinel Generator',
             ),
-        'utility_scope_03': Utility(
-            'utility_scope_03',
-            "High-powered Scope",
+        'utility_sidearm_01': (
+            'Sidearm I',
             ),
-        'utility_cogs_01': Utility(
-            'utility_cogs_01',
-            "Cog Chain I",
+        'utility_sidearm_02': (
+            'Sidearm II',
             ),
-        'utility_cogs_02': Utility(
-            'utility_cogs_02',
-            "Cog Chain II",
+        'utility_sidearm_03': (
+            'Sidearm III',
             ),
-        'utility_cogs_03': Utility(
-            'utility_cogs_03',
-            "Cog Chain III",
+        'utility_sidearm_04': (
+            'Sidearm IV',
             ),
-        'utility_aura_plus': Utility(
-            'utility_aura_plus',
-            "Aura Booster",
+        'utility_sidearm_05': (
+            'Sidearm V',
             ),
-        'utility_aura_plus_rare': Utility(
-            'utility_aura_plus_rare',
-            "Super Aura Booster",
+        'utility_sidearm_01_rare': (
+            'Sniper Sidearm',
             ),
-        'utility_radiance_rare': Utility(
-            'utility_radiance_rare',
-            "Radiance",
+        'utility_boots_03_rare': (
+            'Sonic Boots',
             ),
-        'utility_taser_rare': Utility(
-            'utility_taser_rare',
-            "Remote Taser",
+        'utility_boots_01_rare': (
+            'Speed Boots',
             ),
-        'utility_armor_boost_01_rare': Utility(
-            'utility_armor_boost_01_rare',
-            "Sentinel Generator",
+        'utility_grenade_03_rare': (
+            'Stun Grenade',
             ),
-        'utility_jetpack': Utility(
-            'utility_jetpack',
-            "Jetpack",
+        'utility_aura_plus_rare': (
+            'Super Aura Booster',
             ),
-        'utility_goggles_rare': Utility(
-            'utility_goggles_rare',
-            "Critical Goggles",
+        'utility_sidearm_06_rare': (
+            'Sushi Sidearm',
             ),
-        'utility_goggles_02_rare': Utility(
-            'utility_goggles_02_rare',
-            "Precision Goggles",
+        'utility_damage_rare': (
+            'T-1000 Titanium Casings',
             ),
-        'utility_pain_rare': Utility(
-            'utility_pain_rare',
-            "Pain Amulet",
+        'utility_alloy_rare': (
+            'Titanium Alloy',
             ),
-        'utility_alloy_rare': Utility(
-            'utility_alloy_rare',
-            "Titanium Alloy",
+        'utility_experience_badge_02_rare': (
+            'Ultimate Badge',
             ),
-        'utility_damage_rare': Utility(
-            'utility_damage_rare',
-            "T-1000 Titanium Casings",
+        'utility_boots_warm': (
+            'Warm Boots',
             ),
-        'utility_cool_rare': Utility(
-            'utility_cool_rare',
-            "Cooler Unit",
+        'utility_knuckle_01_rare': (
+            'Warm Gloves',
             ),
-        'utility_experience_badge_01_rare': Utility(
-            'utility_experience_badge_01_rare',
-            "Experience Badge",
+        'utility_warm': (
+            'Warm Scarf',
             ),
-        'utility_experience_badge_02_rare': Utility(
-            'utility_experience_badge_02_rare',
-            "Ultimate Badge",
+        'utility_weapon_charger': (
+            'Weapon Charger',
             ),
-        }
+        })
 
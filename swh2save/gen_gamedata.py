@@ -21,19 +21,269 @@ import io
 import sys
 import zipfile
 import datetime
-import textwrap
 import argparse
+import py_compile
+import concurrent.futures
 
 import xml.etree.ElementTree as ET
 
 
-def quote_string(string, to_quote='"'):
+# The static portion of the generated gamedata.py: license header, plus all
+# the classes used by the data structures we generate.
+GAMEDATA_HEADER = """
+# Copyright (C) 2024 Christopher J. Kucera
+#
+# swh2save is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>
+
+import collections.abc
+
+
+class GameData:
+
+    def __init__(self, name, label):
+        self.name = name
+        self.label = label
+        # Casefolded label, used for sorting
+        self._sort_key = label.casefold()
+
+    def __str__(self):
+        return f'{self.label} ({self.name})'
+
+    def __lt__(self, other):
+        if isinstance(other, GameData):
+            return self._sort_key < other._sort_key
+        else:
+            return self._sort_key < other.casefold()
+
+    def __gt__(self, other):
+        if isinstance(other, GameData):
+            return self._sort_key > other._sort_key
+        else:
+            return self._sort_key > other.casefold()
+
+
+class AliasMap(collections.abc.Mapping):
+    \"\"\"
+    Read-only mapping which lets objects be looked up either by their real
+    name (in `real`), or by any of the aliases in `aliases`, which map from
+    the alias to the real name.  Saves us from having to store a second
+    full copy of the dict just to support the in-game names.
+    \"\"\"
+
+    def __init__(self, real, aliases):
+        self.real = real
+        self.aliases = aliases
+
+    def __getitem__(self, key):
+        try:
+            return self.real[key]
+        except KeyError:
+            return self.real[self.aliases[key]]
+
+    def __iter__(self):
+        yield from self.real
+        yield from self.aliases
+
+    def __len__(self):
+        return len(self.real) + len(self.aliases)
+
+
+class LazyMap(collections.abc.Mapping):
+    \"\"\"
+    Read-only mapping which holds the raw constructor arguments for a bunch
+    of GameData objects (everything but the name, which is the key), and
+    only builds each object the first time it's asked for.  Most runs of
+    the editor only ever touch a handful of these.
+    \"\"\"
+
+    def __init__(self, cls, data):
+        self.cls = cls
+        self.data = data
+        self.cache = {}
+
+    def __getitem__(self, key):
+        obj = self.cache.get(key)
+        if obj is None:
+            obj = self.cls(key, *self.data[key])
+            self.cache[key] = obj
+        return obj
+
+    def __contains__(self, key):
+        return key in self.data
+
+    def __iter__(self):
+        return iter(self.data)
+
+    def __len__(self):
+        return len(self.data)
+
+
+class Experience:
+    \"\"\"
+    Holds information about what the XP requirements are for levels.  Note
+    that this is *not* a GameData object.
+    \"\"\"
+
+    def __init__(self, xp_reqs):
+        \"\"\"
+        `xp_reqs` should be a list of the XP values required to unlock the
+        various levels
+        \"\"\"
+        self.level_to_xp = list(xp_reqs)
+        self.max_xp = self.level_to_xp[-1]
+        self.max_level = len(self.level_to_xp)-1
+
+
+    def __len__(self):
+        return len(self.level_to_xp)
+
+
+class Job(GameData):
+
+    def __init__(self, name, label, skills):
+        super().__init__(name, label)
+        self.skills = skills
+
+
+class Weapon(GameData):
+
+    def __init__(self, name, label, job):
+        super().__init__(name, label)
+        self.job = job
+
+
+class Crew(GameData):
+
+    def __init__(self, name, label, default_job, default_hat):
+        super().__init__(name, label)
+        self.default_job = default_job
+        self.default_hat = default_hat
+
+
+class Upgrade(GameData):
+
+    def __init__(self, name, label, keyitem, category):
+        super().__init__(name, label)
+        self.keyitem = keyitem
+        self.category = category
+
+
+class KeyItem(GameData):
+
+    def __init__(self, name, label, upgrades=None):
+        super().__init__(name, label)
+        if upgrades is None:
+            self.upgrades = []
+        else:
+            self.upgrades = upgrades
+
+
+class Hat(GameData):
+    pass
+
+
+class ShipEquipment(GameData):
+    pass
+
+
+class Utility(GameData):
+    pass
+
+
+"""
+
+
+# Templates for the individual records in the generated dicts.  Each of these
+# gets filled in with `str.format` and written out with a single call.  The
+# records are the constructor arguments (minus the name) which LazyMap uses
+# to build the objects on-demand.
+JOB_TEMPLATE = """        {name!r}: (
+            {label!r},
+            [
+{skills}                ],
+            ),
+"""
+
+JOB_SKILL_LEVEL_TEMPLATE = """                [
+{skills}                    ],
+"""
+
+WEAPON_TEMPLATE = """        {name!r}: (
+            {label!r},
+            JOBS[{job!r}],
+            ),
+"""
+
+CREW_TEMPLATE = """        {name!r}: (
+            {label!r},
+            JOBS[{job!r}],
+            {hat!r},
+            ),
+"""
+
+UPGRADE_TEMPLATE = """        {name!r}: (
+            {label!r},
+            {keyitem!r},
+            {upgrade_type!r},
+            ),
+"""
+
+KEYITEM_TEMPLATE = """        {name!r}: (
+            {label!r},
+{upgrades}            ),
+"""
+
+SIMPLE_TEMPLATE = """        {name!r}: (
+            {label!r},
+            ),
+"""
+
+
+# Labels to add onto ship upgrades which boost crew stats, keyed by the tag
+# found inside `CrewStats`.  Anything not in here is ignored.
+CREW_STAT_LABELS = {
+    'HitPoints': 'Health',
+    'MoveDistance': 'Move Distance',
+    'AoERange': 'Aura',
+    'MeleeDamage': 'Melee Damage',
+    'CogCapacity': 'Cogs',
+    'Aim': 'Aim',
+    'Damage': 'Damage',
+    }
+
+
+def iter_records(xml_file):
     """
-    Quote a string which is being passed inside our constructed Python code.
-    This is pretty stupid, but since this stuff gets looked-over by hand
-    after generation, it's good enough for me.
+    Streams through the XML in `xml_file`, yielding each top-level child
+    of the root element once it's been fully parsed.  Each record is
+    cleared out after the caller's done with it, so we're only ever holding
+    a single record in memory, rather than the whole tree.  Don't hang on
+    to the yielded elements!
     """
-    return string.replace(to_quote, f'\\{to_quote}')
+    depth = 0
+    root = None
+    for event, elem in ET.iterparse(xml_file, events=('start', 'end')):
+        if event == 'start':
+            if depth == 0:
+                root = elem
+            depth += 1
+        else:
+            depth -= 1
+            if depth == 1:
+                yield elem
+                elem.clear()
+                root.remove(elem)
 
 
 def main():
@@ -92,525 +342,429 @@ def main():
     core_dir = os.path.join(args.gamedir, 'Bundle', 'Core')
     output_file = os.path.join('swh2save', 'gamedata.py')
 
-    with open(output_file, 'w') as odf:
-
-        print('# File has been autogenerated by gen_game_data.py', file=odf)
-        print('# Generated on: {}'.format(
-            datetime.datetime.now(datetime.timezone.utc).replace(microsecond=0).isoformat()
-            ), file=odf)
-        print("# Don't edit by hand!", file=odf)
-        
-        print(textwrap.dedent("""
-            # Copyright (C) 2024 Christopher J. Kucera
-            #
-            # swh2save is free software: you can redistribute it and/or modify
-            # it under the terms of the GNU General Public License as published by
-            # the Free Software Foundation, either version 3 of the License, or
-            # (at your option) any later version.
-            #
-            # This program is distributed in the hope that it will be useful,
-            # but WITHOUT ANY WARRANTY; without even the implied warranty of
-            # MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
-            # GNU General Public License for more details.
-            #
-            # You should have received a copy of the GNU General Public License
-            # along with this program.  If not, see <http://www.gnu.org/licenses/>
-
-
-            class GameData:
+    buf = io.StringIO()
+    emit = buf.write
 
-                def __init__(self, name, label):
-                    self.name = name
-                    self.label = label
-
-                def __str__(self):
-                    return f'{self.label} ({self.name})'
-
-                def __lt__(self, other):
-                    if isinstance(other, GameData):
-                        return self.label.casefold() < other.label.casefold()
-                    else:
-                        return self.label.casefold() < other.casefold()
-
-                def __gt__(self, other):
-                    if isinstance(other, GameData):
-                        return self.label.casefold() > other.label.casefold()
-                    else:
-                        return self.label.casefold() > other.casefold()
-
-
-            class Experience:
-                \"\"\"
-                Holds information about what the XP requirements are for levels.  Note
-                that this is *not* a GameData object.
-                \"\"\"
-
-                def __init__(self, xp_reqs):
-                    \"\"\"
-                    `xp_reqs` should be a list of the XP values required to unlock the
-                    various levels
-                    \"\"\"
-                    self.xp_to_level = {}
-                    self.level_to_xp = {}
-                    for level, xp_req in enumerate(xp_reqs):
-                        self.xp_to_level[xp_req] = level
-                        self.level_to_xp[level] = xp_req
-                        self.max_xp = xp_req
-                        self.max_level = level
-
-
-                def __len__(self):
-                    return len(self.xp_to_level)
-
-
-            class Job(GameData):
-
-                def __init__(self, name, label, skills):
-                    super().__init__(name, label)
-                    self.skills = skills
-
-
-            class Weapon(GameData):
-
-                def __init__(self, name, label, job):
-                    super().__init__(name, label)
-                    self.job = job
-
-
-            class Crew(GameData):
-
-                def __init__(self, name, label, default_job, default_hat):
-                    super().__init__(name, label)
-                    self.default_job = default_job
-                    self.default_hat = default_hat
-
-
-            class Upgrade(GameData):
-
-                def __init__(self, name, label, keyitem, category):
-                    super().__init__(name, label)
-                    self.keyitem = keyitem
-                    self.category = category
-
-
-            class KeyItem(GameData):
-
-                def __init__(self, name, label, upgrades=None):
-                    super().__init__(name, label)
-                    if upgrades is None:
-                        self.upgrades = []
-                    else:
-                        self.upgrades = upgrades
-
-
-            class Hat(GameData):
-                pass
-
-
-            class ShipEquipment(GameData):
-                pass
-
-
-            class Utility(GameData):
-                pass
-
-            """), file=odf)
-
-        with zipfile.ZipFile(os.path.join(core_dir, 'Game.pak')) as game_pak:
-
-            # We'll need this for a couple of data types
-            weapon_job_mapping = {}
-
-            # First up: load in strings for our selected language
-            # TODO: really I should be supporting all languages the game supports.
-            # I realize that doing this from the start is almost certainly simpler
-            # than doing it later, but I'm feeling lazy in the short-term.
-            labels = {}
-            with game_pak.open(f'Language/{args.language}.csv') as language_csv:
-                # Not actually using a CSV processor.  Will I regret it?  Time will tell!
-                text_file = io.TextIOWrapper(language_csv)
-                for line in text_file:
-                    line = line.strip()
-                    if line == '':
-                        continue
-                    if line.startswith('#'):
-                        continue
-                    parts = line.split("\t")
-                    # The fields seem to be: key, translation, comment
-                    # comment is optional
-                    if len(parts) < 2:
-                        continue
-                    labels[parts[0]] = parts[1]
-
-
-            # Pull in some job information
-            with game_pak.open('Definitions/jobs.xml') as job_xml:
-
-                root = ET.fromstring(job_xml.read())
-
-                # First up: Experience
-                xp_reqs = ['0']
-                first = root[0]
-                for child in first:
-                    if child.tag == 'ExperienceLevels':
-                        for inner_child in child:
-                            if inner_child.tag == 'Level':
-                                # Not turning these into ints, since all we're doing
-                                # is joining them as strings anyway.
-                                xp_reqs.append(inner_child.text)
-                        break
-                if len(xp_reqs) == 0:
-                    raise RuntimeError("Couldn't find XP->Level values")
-                print('XP = Experience([{}])'.format(
-                    ', '.join(xp_reqs),
-                    ), file=odf)
-                print('', file=odf)
-
-                # Now the actual jobs themselves
-                job_redirects = {}
-                print('JOBS_REAL = {', file=odf)
-                for child in root:
-                    if 'Abstract' in child.attrib:
-                        continue
-                    name = child.attrib['Name']
-                    label = labels[f'job_{name}']
-                    job_redirects[name] = name
-                    job_redirects[label.lower()] = name
-                    skills = []
-                    for inner_child in child:
-                        if inner_child.tag == 'Upgrades':
-                            for upgrade in inner_child:
-                                upgrade_level = int(upgrade.attrib['Level'])
-                                upgrade_name = upgrade.text
-                                if upgrade_level+1 > len(skills):
-                                    skills.append([])
-                                skills[-1].append(upgrade_name)
-                            break
-                    print("        '{}': Job(".format(name), file=odf)
-                    print("            '{}',".format(name), file=odf)
-                    print("            \"{}\",".format(quote_string(label)), file=odf)
-                    print("            [", file=odf)
-                    for level in skills:
-                        print("                [", file=odf),
-                        for skill in level:
-                            print("                    '{}',".format(skill), file=odf)
-                        print("                    ],", file=odf)
-                    print("                ],", file=odf)
-                    print("            ),", file=odf)
-                print('        }', file=odf)
-                print('', file=odf)
-
-                # And also, we want users to be able to be able to refer to jobs
-                # by their in-game names.
-                print('JOBS = {', file=odf)
-                for job_usable, job_real in job_redirects.items():
-                    print(f"        '{job_usable}': JOBS_REAL['{job_real}'],", file=odf)
-                print('        }', file=odf)
-                print('', file=odf)
-
-            # Next up, what weapons belong to which jobs.  I'm storing this because
-            # I want to be able to level up the "current" class for crew, and the
-            # only real way to do that is via their weapon.  (I'll also want it for
-            # unlocking crew, because I want to be able to give XP in their "default"
-            # class, which is defined only by their default weapon.)
-            with game_pak.open('Definitions/weapons.xml') as xml_data:
-
-                # A list of weapons we know we don't want to bother with.  These are
-                # virtualish weapons used as part of char skills, I think.  Shouldn't
-                # ever show up in inventory lists
-                known_weapon_skips = {
-                        'weapon_utility_grenade_launcher_no_aimline',
-                        'weapon_utility_grenade_launcher_crippled',
-                        'weapon_utility_grenade_launcher_stun',
-                        'weapon_utility_grenade_launcher_ice',
-                        'weapon_utility_rocket_launcher_01',
-                        'weapon_utility_rocket_launcher_02',
-                        'weapon_utility_sidearm_01_aimline',
-                        'weapon_action_stun_gun',
-                        'weapon_action_diver_laser',
-                        }
-
-                print('WEAPONS = {', file=odf)
-                root = ET.fromstring(xml_data.read())
-                for child in root:
-                    name = child.attrib['Name']
-
-                    # Figure out what job this gun belongs to, first reading from
-                    # a template (if we're inheriting from one), and then from tags
-                    # directly on the weapon.
-                    job = None
-                    if 'Template' in child.attrib:
-                        job = weapon_job_mapping[child.attrib['Template']]
-                    for inner_child in child:
-                        if inner_child.tag == 'Job':
-                            job = inner_child.text
-                            break
-                    weapon_job_mapping[name] = job
-
-                    # Now, if we're part of the known skips, skip us!
-                    if name in known_weapon_skips:
-                        continue
-
-                    # Now if we're abstract, continue on -- don't actually care about it.
-                    if 'Abstract' in child.attrib:
-                        continue
-
-                    # Likewise, if we've been set as a Virtual weapon, we sort of don't care.
-                    # Continue.
-                    got_virtual = False
-                    for inner_child in child:
-                        if inner_child.tag == 'Virtual' and inner_child.text == 'true':
-                            got_virtual = True
-                            break
-                    if got_virtual:
-                        continue
-
-                    # Get our english label
-                    label_lookup = f'weapon_{name}'
-                    if label_lookup not in labels:
-                        print(f'NOTICE: skipping Weapon "{name}"; no translation found.')
-                        continue
-                    label = labels[label_lookup]
-
-                    # Now output the struct
-                    print(f"        '{name}': Weapon(", file=odf)
-                    print(f"            '{name}',", file=odf)
-                    print("            \"{}\",".format(quote_string(label)), file=odf)
-                    print(f"            JOBS['{job}'],", file=odf)
-                    print("            ),", file=odf)
-                print('        }', file=odf)
-                print('', file=odf)
-
-
-            # Prep for crew: get their default hat
-            crew_hat_mapping = {}
-            with game_pak.open('Definitions/entities.crew.xml') as crew_xml:
-
-                root = ET.fromstring(crew_xml.read())
-                for child in root:
-                    name = child.attrib['Name']
-                    if name.startswith('crew_'):
-                        for inner_child in child:
-                            if inner_child.tag == 'Actor':
-                                for actor_child in inner_child:
-                                    if actor_child.tag == 'Hat':
-                                        crew_hat_mapping[name[5:]] = actor_child.text
-                                        break
-                                break
-
-            # Then: crew
-            with game_pak.open('Definitions/personas.xml') as persona_xml:
-
-                crew_redirects = {}
-                print('CREW_REAL = {', file=odf)
-                root = ET.fromstring(persona_xml.read())
-                for child in root:
-                    if 'Abstract' in child.attrib:
-                        continue
-                    if 'Template' not in child.attrib or child.attrib['Template'] != 'CREW':
-                        continue
-                    name = child.attrib['Name']
-                    label = labels[f'persona_{name}']
-                    crew_redirects[name] = name
-                    crew_redirects[label.lower()] = name
-                    job = None
-                    for inner_child in child:
-                        if inner_child.tag == 'DefaultWeapon':
-                            default_weapon = inner_child.text
-                            job = weapon_job_mapping[default_weapon]
-                            break
-                    if job is None:
-                        raise RuntimeError(f'No default job found for crew: {name}')
-                    print(f"        '{name}': Crew(", file=odf)
-                    print(f"            '{name}',", file=odf)
-                    print("            \"{}\",".format(quote_string(label)), file=odf)
-                    print(f"            JOBS['{job}'],", file=odf)
-                    print(f"            '{crew_hat_mapping[name]}',", file=odf)
-                    print("            ),", file=odf)
-                print('        }', file=odf)
-                print('', file=odf)
-
-                # And also, we want users to be able to be able to refer to crew
-                # by their in-game names.
-                print('CREW = {', file=odf)
-                for crew_usable, crew_real in crew_redirects.items():
-                    print(f"        '{crew_usable}': CREW_REAL['{crew_real}'],", file=odf)
-                print('        }', file=odf)
-                print('', file=odf)
-
-
-            # Some keyitems and upgrades a pretty closely related, and I'd like to be able
-            # to enable/disable them together.  So key items need to know what upgrade(s)
-            # they unlock, and upgrades need to know what key items are required.  In some
-            # cases it hardly matters; if you add the key item to the save, the game will
-            # automatically unlock the upgrade, for instance.  But adding an *upgrade*
-            # should really add the relevant key items, and removing either should really
-            # remove their counterparts.  Also, for key-item-unlocked upgrades, the item
-            # name seems to be the only decent way to get an english string for the upgrade
-            # name, so we're pulling it from there.
-            #
-            # So anyway, we need to read key items first so we can get the key item names
-            # (to put that info in the upgrades structure), but we also need to read the
-            # upgrades first to find out which key items they require.  Fun!  So we'll
-            # be sort of doing a double-loop for one of them.  The simplest one to do first
-            # is KeyItems, so we'll be doing *that* to get the names, then looping through
-            # ugprades, and then looping through key items yet again.
-            keyitems = {}
-            with game_pak.open('Definitions/key_items.xml') as keyitem_xml:
-                root = ET.fromstring(keyitem_xml.read())
-                for child in root:
-                    if 'Abstract' in child.attrib:
-                        continue
-                    loc_name = child.attrib['Name']
-                    for inner_child in child:
-                        if inner_child.tag == 'LocalizedNameId':
-                            loc_name = inner_child.text
-                            break
-                    keyitems[child.attrib['Name']] = labels[loc_name]
-
-
-            # Now a list of ship upgrades
-            key_item_to_upgrade = {}
-            with game_pak.open('Definitions/ship_upgrades.xml') as ship_upgrades:
-
-                print('UPGRADES = {', file=odf)
-                root = ET.fromstring(ship_upgrades.read())
-                upgrade_template_types = {}
-                for child in root:
-                    if 'Abstract' in child.attrib:
-                        for inner_child in child:
-                            if inner_child.tag == 'Type':
-                                upgrade_template_types[child.attrib['Name']] = inner_child.text
-                                break
-                        continue
-                    keyitem = None
-                    optional_layer = None
-                    upgrade_type = None
-                    name_string_id = None
-                    label_suffixes = []
-                    for inner_child in child:
-                        match inner_child.tag:
-                            case 'KeyItem':
-                                keyitem = inner_child.text
-                                # Keep track of the keyitem->upgrade mapping
-                                if keyitem not in key_item_to_upgrade:
-                                    key_item_to_upgrade[keyitem] = []
-                                key_item_to_upgrade[keyitem].append(child.attrib['Name'])
-                            case 'ShowOptionalLayer':
-                                optional_layer = inner_child.text
-                            case 'Type':
-                                upgrade_type = inner_child.text
-                            case 'NameStringId':
-                                name_string_id = inner_child.text
-                            case 'CrewStats':
-                                for even_more_inner_child in inner_child:
-                                    match even_more_inner_child.tag:
-                                        case 'HitPoints':
-                                            label_suffixes.append('Health')
-                                        case 'MoveDistance':
-                                            label_suffixes.append('Move Distance')
-                                        case 'AoERange':
-                                            label_suffixes.append('Aura')
-                                        case 'MeleeDamage':
-                                            label_suffixes.append('Melee Damage')
-                                        case 'CogCapacity':
-                                            label_suffixes.append('Cogs')
-                                        case 'Aim':
-                                            label_suffixes.append('Aim')
-                                        case 'Damage':
-                                            label_suffixes.append('Damage')
-                            case 'ExperienceBonus':
-                                label_suffixes.append('XP Bonus')
-                    # Some slightly dodgy attempts to find the name shown in the game,
-                    # but it seems to work fine.
-                    if name_string_id is not None:
-                        label = labels[name_string_id]
-                    elif optional_layer is not None:
-                        label = labels[optional_layer]
-                    elif keyitem is not None:
-                        label = keyitems[keyitem]
-                    else:
-                        test_label_name = 'ship_upgrade_{}'.format(child.attrib['Name'])
-                        if test_label_name in labels:
-                            label = labels[test_label_name]
-                        else:
-                            label = child.attrib['Name']
-                    if label_suffixes:
-                        # These are intended for the Celestial Gears, but they show up in
-                        # other upgrades too.  That's mostly fine, though I want to prevent
-                        # it from adding `(Cogs)` to the `Extra Cog` upgrade, since that's
-                        # kind of redundant and weird-looking.
-                        if label != 'Extra Cog':
-                            label = '{} ({})'.format(
-                                    label,
-                                    ', '.join(label_suffixes),
-                                    )
-                    if upgrade_type is None \
-                            and 'Template' in child.attrib \
-                            and child.attrib['Template'] in upgrade_template_types:
-                        upgrade_type = upgrade_template_types[child.attrib['Template']]
-                    print("        '{}': Upgrade(".format(child.attrib['Name']), file=odf)
-                    print("            '{}',".format(child.attrib['Name']), file=odf)
-                    print("            \"{}\",".format(quote_string(label)), file=odf)
-                    if keyitem is None:
-                        print("            None,", file=odf)
-                    else:
-                        print("            '{}',".format(keyitem), file=odf)
-                    if upgrade_type is None:
-                        print("            None,", file=odf)
-                    else:
-                        print("            '{}',".format(upgrade_type), file=odf)
-                    print("            ),", file=odf)
-                print('        }', file=odf)
-                print('', file=odf)
-
-
-            # Now back to key items
-            print('KEY_ITEMS = {', file=odf)
-            for keyitem_name, keyitem_label in keyitems.items():
-                print("        '{}': KeyItem(".format(keyitem_name), file=odf)
-                print("            '{}',".format(keyitem_name), file=odf)
-                print("            \"{}\",".format(quote_string(keyitem_label)), file=odf)
-                if keyitem_name in key_item_to_upgrade:
-                    print("            [{}],".format(
-                        ', '.join(["'{}'".format(n) for n in key_item_to_upgrade[keyitem_name]]),
-                        ), file=odf)
-                print("            ),", file=odf)
-            print('        }', file=odf)
-            print('', file=odf)
-
-
-            # Now a few datatypes that we're handling similarly.
-            for xml_filename, var_name, class_name in [
-                    ('Definitions/hats.xml', 'HATS', 'Hat'),
-                    ('Definitions/ship_equipment.xml', 'SHIP_EQUIPMENT', 'ShipEquipment'),
-                    ('Definitions/utilities.xml', 'UTILITIES', 'Utility'),
-                    ]:
-
-                with game_pak.open(xml_filename) as xml_data:
-
-                    print(f'{var_name} = {{', file=odf)
-                    root = ET.fromstring(xml_data.read())
-                    for child in root:
-                        if 'Abstract' in child.attrib:
-                            continue
-                        name = child.attrib['Name']
-                        got_virtual = False
-                        for inner_child in child:
-                            if inner_child.tag == 'Virtual' and inner_child.text == 'true':
-                                got_virtual = True
-                                break
-                        if got_virtual:
-                            continue
-                        if name not in labels:
-                            print(f'NOTICE: skipping {class_name} "{name}"; no translation found.')
-                            continue
-                        print(f"        '{name}': {class_name}(", file=odf)
-                        print(f"            '{name}',", file=odf)
-                        print("            \"{}\",".format(quote_string(labels[name])), file=odf)
-                        print("            ),", file=odf)
-                    print('        }', file=odf)
-                    print('', file=odf)
+    emit('# File has been autogenerated by gen_game_data.py\n')
+    emit('# Generated on: {}\n'.format(
+        datetime.datetime.now(datetime.timezone.utc).replace(microsecond=0).isoformat()
+        ))
+    emit("# Don't edit by hand!\n")
+    
+    emit(GAMEDATA_HEADER)
+
+    with zipfile.ZipFile(os.path.join(core_dir, 'Game.pak')) as game_pak:
+
+        # Look up all the pak members we're going to need just the once, which
+        # also lets us bail out early if any of them are missing.
+        language_file = f'Language/{args.language}.csv'
+        members = {}
+        for member_name in [
+                language_file,
+                'Definitions/jobs.xml',
+                'Definitions/weapons.xml',
+                'Definitions/entities.crew.xml',
+                'Definitions/personas.xml',
+                'Definitions/key_items.xml',
+                'Definitions/ship_upgrades.xml',
+                'Definitions/hats.xml',
+                'Definitions/ship_equipment.xml',
+                'Definitions/utilities.xml',
+                ]:
+            try:
+                members[member_name] = game_pak.getinfo(member_name)
+            except KeyError:
+                raise RuntimeError(f'Could not find {member_name} inside Game.pak')
+
+        # We'll need this for a couple of data types
+        weapon_job_mapping = {}
+
+        # First up: load in strings for our selected language
+        # TODO: really I should be supporting all languages the game supports.
+        # I realize that doing this from the start is almost certainly simpler
+        # than doing it later, but I'm feeling lazy in the short-term.
+        labels = {}
+        # Not actually using a CSV processor.  Will I regret it?  Time will tell!
+        # The file's small enough that we may as well just read it in one go.
+        # I did consider only keeping the labels we actually end up using, but
+        # we look them up in too many different ways (prefixed names, various
+        # ID tags, and the bare names themselves, sometimes just as an `in`
+        # test), and keeping a separate "wanted" list in sync with all that
+        # would be an easy way to silently lose data.  Not worth it.
+        language_csv = game_pak.read(members[language_file])
+        # We work on the raw bytes and only decode the two fields we keep, so
+        # comment lines and the comment field never get decoded at all.
+        for line in language_csv.splitlines():
+            line = line.strip()
+            if not line or line[:1] == b'#':
+                continue
+            # The fields seem to be: key, translation, comment
+            # comment is optional
+            fields = line.split(b'\t', 2)
+            if len(fields) < 2:
+                continue
+            labels[fields[0].decode('utf-8')] = fields[1].decode('utf-8')
+
+
+        # Pull in some job information.  This one's small, and we need to look
+        # at its first record before emitting any of the others, so it's
+        # easiest to just build the whole tree rather than streaming it.
+        with game_pak.open(members['Definitions/jobs.xml']) as jobs_xml:
+            root = ET.parse(jobs_xml).getroot()
+
+        # First up: Experience
+        xp_reqs = ['0']
+        xp_levels = root[0].find('ExperienceLevels')
+        if xp_levels is not None:
+            # Not turning these into ints, since all we're doing
+            # is joining them as strings anyway.
+            xp_reqs.extend([level.text for level in xp_levels.findall('Level')])
+        if len(xp_reqs) == 0:
+            raise RuntimeError("Couldn't find XP->Level values")
+        emit('XP = Experience([{}])\n'.format(
+            ', '.join(xp_reqs),
+            ))
+        emit('\n')
+
+        # Now the actual jobs themselves
+        job_aliases = {}
+        emit('JOBS_REAL = LazyMap(Job, {\n')
+        for child in root:
+            if child.get('Abstract') is not None:
+                continue
+            name = child.get('Name')
+            label = labels[f'job_{name}']
+            if label.lower() != name:
+                job_aliases[label.lower()] = name
+            skills = []
+            upgrades = child.find('Upgrades')
+            if upgrades is not None:
+                # Size the list up front and slot each skill in by its level,
+                # so we don't care what order they show up in.
+                levels = [(int(upgrade.get('Level')), upgrade.text) for upgrade in upgrades]
+                if levels:
+                    skills = [[] for _ in range(max([level for level, _ in levels])+1)]
+                    for upgrade_level, upgrade_name in levels:
+                        skills[upgrade_level].append(upgrade_name)
+            emit(JOB_TEMPLATE.format(
+                name=name,
+                label=label,
+                skills=''.join([
+                    JOB_SKILL_LEVEL_TEMPLATE.format(
+                        skills=''.join([f'                    {skill!r},\n' for skill in level]),
+                        )
+                    for level in skills
+                    ]),
+                ))
+        emit('        })\n')
+        emit('\n')
+
+        # And also, we want users to be able to be able to refer to jobs
+        # by their in-game names.
+        emit('JOBS = AliasMap(JOBS_REAL, {\n')
+        for job_alias, job_real in job_aliases.items():
+            emit(f"        {job_alias!r}: {job_real!r},\n")
+        emit('        })\n')
+        emit('\n')
+
+        # Next up, what weapons belong to which jobs.  I'm storing this because
+        # I want to be able to level up the "current" class for crew, and the
+        # only real way to do that is via their weapon.  (I'll also want it for
+        # unlocking crew, because I want to be able to give XP in their "default"
+        # class, which is defined only by their default weapon.)
+
+        # A list of weapons we know we don't want to bother with.  These are
+        # virtualish weapons used as part of char skills, I think.  Shouldn't
+        # ever show up in inventory lists
+        known_weapon_skips = {
+                'weapon_utility_grenade_launcher_no_aimline',
+                'weapon_utility_grenade_launcher_crippled',
+                'weapon_utility_grenade_launcher_stun',
+                'weapon_utility_grenade_launcher_ice',
+                'weapon_utility_rocket_launcher_01',
+                'weapon_utility_rocket_launcher_02',
+                'weapon_utility_sidearm_01_aimline',
+                'weapon_action_stun_gun',
+                'weapon_action_diver_laser',
+                }
+
+        emit('WEAPONS = LazyMap(Weapon, {\n')
+        with game_pak.open(members['Definitions/weapons.xml']) as weapons_xml:
+            for child in iter_records(weapons_xml):
+                name = child.get('Name')
+
+                # Figure out what job this gun belongs to, first reading from
+                # a template (if we're inheriting from one), and then from tags
+                # directly on the weapon.
+                job = None
+                template = child.get('Template')
+                if template is not None:
+                    job = weapon_job_mapping[template]
+                job_elem = child.find('Job')
+                if job_elem is not None:
+                    job = job_elem.text
+                weapon_job_mapping[name] = job
+
+                # Now, if we're part of the known skips, skip us!
+                if name in known_weapon_skips:
+                    continue
+
+                # Now if we're abstract, continue on -- don't actually care about it.
+                if child.get('Abstract') is not None:
+                    continue
+
+                # Likewise, if we've been set as a Virtual weapon, we sort of don't care.
+                # Continue.
+                if child.findtext('Virtual') == 'true':
+                    continue
+
+                # Get our english label
+                label = labels.get(f'weapon_{name}')
+                if label is None:
+                    print(f'NOTICE: skipping Weapon "{name}"; no translation found.')
+                    continue
+
+                # Now output the struct
+                emit(WEAPON_TEMPLATE.format(name=name, label=label, job=job))
+        emit('        })\n')
+        emit('\n')
+
+
+        # Prep for crew: get their default hat
+        crew_hat_mapping = {}
+        with game_pak.open(members['Definitions/entities.crew.xml']) as crew_xml:
+            for child in iter_records(crew_xml):
+                name = child.get('Name')
+                if name.startswith('crew_'):
+                    hat_elem = child.find('Actor/Hat')
+                    if hat_elem is not None:
+                        crew_hat_mapping[name[5:]] = hat_elem.text
+
+        # Then: crew
+        crew_aliases = {}
+        emit('CREW_REAL = LazyMap(Crew, {\n')
+        with game_pak.open(members['Definitions/personas.xml']) as personas_xml:
+            for child in iter_records(personas_xml):
+                if child.get('Abstract') is not None:
+                    continue
+                if child.get('Template') != 'CREW':
+                    continue
+                name = child.get('Name')
+                label = labels[f'persona_{name}']
+                if label.lower() != name:
+                    crew_aliases[label.lower()] = name
+                job = None
+                default_weapon = child.find('DefaultWeapon')
+                if default_weapon is not None:
+                    job = weapon_job_mapping[default_weapon.text]
+                if job is None:
+                    raise RuntimeError(f'No default job found for crew: {name}')
+                emit(CREW_TEMPLATE.format(
+                    name=name,
+                    label=label,
+                    job=job,
+                    hat=crew_hat_mapping[name],
+                    ))
+        emit('        })\n')
+        emit('\n')
+
+        # And also, we want users to be able to be able to refer to crew
+        # by their in-game names.
+        emit('CREW = AliasMap(CREW_REAL, {\n')
+        for crew_alias, crew_real in crew_aliases.items():
+            emit(f"        {crew_alias!r}: {crew_real!r},\n")
+        emit('        })\n')
+        emit('\n')
+
+
+        # The rest of the files we process are independent of each other, so
+        # decompress them concurrently.  zlib releases the GIL while it works,
+        # so this does actually overlap.  (The XML parsing itself holds the GIL,
+        # so that's left to happen serially, below.)
+        with concurrent.futures.ThreadPoolExecutor() as executor:
+            prefetch_names = [
+                    'Definitions/key_items.xml',
+                    'Definitions/ship_upgrades.xml',
+                    'Definitions/hats.xml',
+                    'Definitions/ship_equipment.xml',
+                    'Definitions/utilities.xml',
+                    ]
+            prefetched = dict(zip(
+                prefetch_names,
+                executor.map(lambda member_name: game_pak.read(members[member_name]), prefetch_names),
+                ))
+
+        # Some keyitems and upgrades a pretty closely related, and I'd like to be able
+        # to enable/disable them together.  So key items need to know what upgrade(s)
+        # they unlock, and upgrades need to know what key items are required.  In some
+        # cases it hardly matters; if you add the key item to the save, the game will
+        # automatically unlock the upgrade, for instance.  But adding an *upgrade*
+        # should really add the relevant key items, and removing either should really
+        # remove their counterparts.  Also, for key-item-unlocked upgrades, the item
+        # name seems to be the only decent way to get an english string for the upgrade
+        # name, so we're pulling it from there.
+        #
+        # So anyway, we need to read key items first so we can get the key item names
+        # (to put that info in the upgrades structure), but we also need to read the
+        # upgrades first to find out which key items they require.  Fun!  So we'll
+        # be sort of doing a double-loop for one of them.  The simplest one to do first
+        # is KeyItems, so we'll be doing *that* to get the names, then looping through
+        # ugprades, and then looping through key items yet again.
+        #
+        # Key items without an explicit LocalizedNameId use their own name as the
+        # label ID.
+        root = ET.fromstring(prefetched['Definitions/key_items.xml'])
+        keyitems = {
+                child.get('Name'): labels[child.findtext('LocalizedNameId', child.get('Name'))]
+                for child in root
+                if child.get('Abstract') is None
+                }
+
+
+        # Now a list of ship upgrades
+        key_item_to_upgrade = {}
+        ship_upgrades = prefetched['Definitions/ship_upgrades.xml']
+        # Records are collected up and sorted by label before being written out,
+        # so that the generated dict is already in display order.
+        upgrade_records = []
+        upgrade_template_types = {}
+        for child in iter_records(io.BytesIO(ship_upgrades)):
+            name = child.get('Name')
+            if child.get('Abstract') is not None:
+                type_elem = child.find('Type')
+                if type_elem is not None:
+                    upgrade_template_types[name] = type_elem.text
+                continue
+            keyitem = None
+            optional_layer = None
+            upgrade_type = None
+            name_string_id = None
+            label_suffixes = []
+            for inner_child in child:
+                match inner_child.tag:
+                    case 'KeyItem':
+                        keyitem = inner_child.text
+                        # Keep track of the keyitem->upgrade mapping
+                        if keyitem not in key_item_to_upgrade:
+                            key_item_to_upgrade[keyitem] = []
+                        key_item_to_upgrade[keyitem].append(name)
+                    case 'ShowOptionalLayer':
+                        optional_layer = inner_child.text
+                    case 'Type':
+                        upgrade_type = inner_child.text
+                    case 'NameStringId':
+                        name_string_id = inner_child.text
+                    case 'CrewStats':
+                        for even_more_inner_child in inner_child:
+                            stat_label = CREW_STAT_LABELS.get(even_more_inner_child.tag)
+                            if stat_label is not None:
+                                label_suffixes.append(stat_label)
+                    case 'ExperienceBonus':
+                        label_suffixes.append('XP Bonus')
+            # Some slightly dodgy attempts to find the name shown in the game,
+            # but it seems to work fine.
+            if name_string_id is not None:
+                label = labels[name_string_id]
+            elif optional_layer is not None:
+                label = labels[optional_layer]
+            elif keyitem is not None:
+                label = keyitems[keyitem]
+            else:
+                label = labels.get(f'ship_upgrade_{name}', name)
+            if label_suffixes:
+                # These are intended for the Celestial Gears, but they show up in
+                # other upgrades too.  That's mostly fine, though I want to prevent
+                # it from adding `(Cogs)` to the `Extra Cog` upgrade, since that's
+                # kind of redundant and weird-looking.
+                if label != 'Extra Cog':
+                    label = '{} ({})'.format(
+                            label,
+                            ', '.join(label_suffixes),
+                            )
+            if upgrade_type is None:
+                upgrade_type = upgrade_template_types.get(child.get('Template'))
+            upgrade_records.append((label.casefold(), UPGRADE_TEMPLATE.format(
+                name=name,
+                label=label,
+                keyitem=keyitem,
+                upgrade_type=upgrade_type,
+                )))
+        upgrade_records.sort(key=lambda record: record[0])
+        emit('# Sorted by label\n')
+        emit('UPGRADES = LazyMap(Upgrade, {\n')
+        for _, record in upgrade_records:
+            emit(record)
+        emit('        })\n')
+        emit('\n')
+
+
+        # Now back to key items
+        emit('KEY_ITEMS = LazyMap(KeyItem, {\n')
+        for keyitem_name, keyitem_label in keyitems.items():
+            if keyitem_name in key_item_to_upgrade:
+                upgrades = '            [{}],\n'.format(
+                        ', '.join([repr(n) for n in key_item_to_upgrade[keyitem_name]]),
+                        )
+            else:
+                upgrades = ''
+            emit(KEYITEM_TEMPLATE.format(
+                name=keyitem_name,
+                label=keyitem_label,
+                upgrades=upgrades,
+                ))
+        emit('        })\n')
+        emit('\n')
+
+
+        # Now a few datatypes that we're handling similarly.
+        for xml_filename, var_name, class_name in [
+                ('Definitions/hats.xml', 'HATS', 'Hat'),
+                ('Definitions/ship_equipment.xml', 'SHIP_EQUIPMENT', 'ShipEquipment'),
+                ('Definitions/utilities.xml', 'UTILITIES', 'Utility'),
+                ]:
+
+            xml_data = prefetched[xml_filename]
+            records = []
+            for child in iter_records(io.BytesIO(xml_data)):
+                if child.get('Abstract') is not None:
+                    continue
+                name = child.get('Name')
+                if child.findtext('Virtual') == 'true':
+                    continue
+                label = labels.get(name)
+                if label is None:
+                    print(f'NOTICE: skipping {class_name} "{name}"; no translation found.')
+                    continue
+                records.append((label.casefold(), SIMPLE_TEMPLATE.format(
+                    name=name,
+                    label=label,
+                    )))
+            records.sort(key=lambda record: record[0])
+            emit('# Sorted by label\n')
+            emit(f'{var_name} = LazyMap({class_name}, {{\n')
+            for _, record in records:
+                emit(record)
+            emit('        })\n')
+            emit('\n')
+
+    # Write everything out in one go, handing the whole thing straight to
+    # the OS rather than going through the buffered text-mode writer.
+    # O_BINARY only exists on Windows.
+    payload = buf.getvalue().encode('utf-8')
+    fd = os.open(output_file,
+            os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0),
+            0o644,
+            )
+    try:
+        view = memoryview(payload)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+    # May as well get the bytecode cached while we're here, so that the
+    # first import doesn't have to parse the whole thing.
+    py_compile.compile(output_file, doraise=True)
 
     print(f'Wrote to: {output_file}')
 
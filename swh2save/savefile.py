@@ -532,6 +532,30 @@ class InventoryItem(Chunk):
         return InventoryItem(odf)
 
 
+    @staticmethod
+    def create_new_batch(first_id, item_names, item_flags):
+        """
+        Creates a list of new items with the given names, with IDs counting up
+        from `first_id`.  This is the same as calling `create_new` on each,
+        but shares a single scratch file for the whole batch, rather than
+        spinning up a new one per item.
+        """
+        # TODO: still absurd and weird; see create_new.
+        if type(item_flags) == InventoryItem.ItemFlag:
+            item_flags = item_flags.value
+        odf = Savefile('foo', do_write=True)
+        for item_id, item_name in enumerate(item_names, start=first_id):
+            odf.write_chunk_header('ItIn')
+            odf.write_uint8(0)
+            odf.write_varint(item_id)
+            odf.write_uint32(item_flags)
+            odf.write_string(item_name)
+            odf.write_uint32(0)
+            odf.write_uint32(0)
+        odf.seek(0)
+        return [InventoryItem(odf) for _ in item_names]
+
+
     def _to_json(self, verbose=False):
         my_dict = {}
         self._json_simple(my_dict, [
@@ -773,6 +797,22 @@ class Inventory(Chunk):
             self.new_items.append(self.last_inventory_id)
 
 
+    def add_items(self, items, item_flags, flag_as_new=True):
+        """
+        Adds a batch of new items to our inventory.  `items` should be an
+        iterable of `(item_name, count)` tuples, and each item will be added
+        `count` times, in order.  All the items will share the same flags.
+        """
+        item_names = []
+        for item_name, count in items:
+            item_names.extend([item_name]*count)
+        first_id = self.last_inventory_id + 1
+        self.items.extend(InventoryItem.create_new_batch(first_id, item_names, item_flags))
+        self.last_inventory_id += len(item_names)
+        if flag_as_new:
+            self.new_items.extend(range(first_id, self.last_inventory_id+1))
+
+
     def _to_json(self, verbose=False):
         my_dict = {}
         self._json_simple(my_dict, [